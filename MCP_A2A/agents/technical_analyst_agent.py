@@ -2,8 +2,11 @@
 TechnicalAnalystAgent - Focuses on price action and market timing analysis.
 """
 
-from typing import Dict, List, Optional
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional, Tuple
 import asyncio
+import time
 from fastapi import FastAPI, Request
 from pydantic import BaseModel, Field
 
@@ -18,15 +21,39 @@ from ..config import PORTS, SERVICE_URLS
 setup_logging("technical_analyst_agent")
 logger = get_logger(__name__)
 
+# Initialize A2A server and HTTP client
+a2a_server = A2AServer()
+http_client = HTTPClient()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Close the pooled HTTP connections on shutdown."""
+    yield
+    await http_client.aclose()
+
+
 app = FastAPI(
     title="TechnicalAnalyst Agent",
     description="Provides technical analysis and market timing signals",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
-# Initialize A2A server and HTTP client
-a2a_server = A2AServer()
-http_client = HTTPClient()
+# Default parameters sent with each indicator request
+DEFAULT_INDICATOR_PARAMS: Dict[str, Dict] = {
+    "RSI": {"period": 14},
+    "SMA": {"period": 20},
+    "EMA": {"period": 20},
+    "MACD": {"fast_period": 12, "slow_period": 26, "signal_period": 9},
+    "BB": {"period": 20, "std_dev": 2.0},
+}
+
+# Recently fetched price data keyed by (ticker, days); values are (fetched_at, data)
+PRICE_CACHE_TTL = 60  # seconds
+PRICE_CACHE_MAX_ENTRIES = 256
+_price_cache: Dict[Tuple[str, int], Tuple[float, StockPrice]] = {}
+_price_fetch_locks: Dict[Tuple[str, int], asyncio.Lock] = defaultdict(asyncio.Lock)
 
 # Request models
 class TechnicalAnalysisRequest(BaseModel):
@@ -38,6 +65,37 @@ class TechnicalAnalysisRequest(BaseModel):
 
 
 async def fetch_price_data(ticker: str, days: int = 50) -> Optional[StockPrice]:
+    """
+    Fetch historical price data, reusing results fetched in the last PRICE_CACHE_TTL seconds.
+    
+    Args:
+        ticker: Stock ticker symbol
+        days: Number of days of historical data
+        
+    Returns:
+        Stock price data or None if failed
+    """
+    key = (ticker, days)
+    
+    # Concurrent requests for the same key wait for a single fetch
+    async with _price_fetch_locks[key]:
+        cached = _price_cache.get(key)
+        if cached and time.monotonic() - cached[0] < PRICE_CACHE_TTL:
+            logger.debug(f"Using cached price data for {ticker} ({days} days)")
+            return cached[1]
+        
+        price_data = await _fetch_price_data_uncached(ticker, days)
+        if price_data is not None:
+            _price_cache.pop(key, None)
+            if len(_price_cache) >= PRICE_CACHE_MAX_ENTRIES:
+                # Entries are kept in insertion order, so the first is the oldest
+                _price_cache.pop(next(iter(_price_cache)))
+            _price_cache[key] = (time.monotonic(), price_data)
+        
+        return price_data
+
+
+async def _fetch_price_data_uncached(ticker: str, days: int) -> Optional[StockPrice]:
     """
     Fetch historical price data from MarketDataMCP.
     
@@ -67,8 +125,29 @@ async def fetch_price_data(ticker: str, days: int = 50) -> Optional[StockPrice]:
         return None
 
 
+def to_price_points(price_data: List[PriceData]) -> List[Dict]:
+    """
+    Convert price data to the format expected by the MCP server.
+    
+    Args:
+        price_data: Historical price data
+        
+    Returns:
+        List of price point dictionaries
+    """
+    return [
+        {
+            "close": point.close,
+            "high": point.high,
+            "low": point.low,
+            "volume": point.volume
+        }
+        for point in price_data
+    ]
+
+
 async def calculate_technical_indicator(
-    price_data: List[PriceData],
+    price_points: List[Dict],
     indicator_name: str,
     params: Dict = None
 ) -> Optional[Dict]:
@@ -76,7 +155,7 @@ async def calculate_technical_indicator(
     Calculate technical indicator using TechnicalAnalysisMCP.
     
     Args:
-        price_data: Historical price data
+        price_points: Historical price data as returned by to_price_points
         indicator_name: Name of the indicator
         params: Indicator parameters
         
@@ -87,16 +166,6 @@ async def calculate_technical_indicator(
         if params is None:
             params = {}
         
-        # Convert price data to format expected by MCP server
-        price_points = []
-        for point in price_data:
-            price_points.append({
-                "close": point.close,
-                "high": point.high,
-                "low": point.low,
-                "volume": point.volume
-            })
-        
         technical_analysis_url = SERVICE_URLS["technical_analysis_mcp"]
         response = await http_client.post(
             f"{technical_analysis_url}/mcp/calculate_indicator",
@@ -118,6 +187,41 @@ async def calculate_technical_indicator(
         return None
 
 
+async def calculate_technical_indicators(
+    price_points: List[Dict],
+    indicator_specs: List[Dict]
+) -> Optional[List[Dict]]:
+    """
+    Calculate several technical indicators in one TechnicalAnalysisMCP call.
+    
+    Args:
+        price_points: Historical price data as returned by to_price_points
+        indicator_specs: Indicators to calculate, each {"name": ..., "params": ...}
+        
+    Returns:
+        Indicator results in request order or None if failed
+    """
+    try:
+        technical_analysis_url = SERVICE_URLS["technical_analysis_mcp"]
+        response = await http_client.post(
+            f"{technical_analysis_url}/mcp/calculate_indicators_fast",
+            json_data={
+                "price_data": price_points,
+                "indicators": indicator_specs
+            }
+        )
+        
+        if response.status_code == 200:
+            return response.json()["results"]
+        else:
+            logger.warning(f"Failed to calculate indicators: {response.status_code}")
+            return None
+            
+    except Exception as e:
+        logger.error(f"Error calculating indicators: {e}")
+        return None
+
+
 def combine_indicator_signals(indicator_results: List[Dict]) -> Dict:
     """
     Combine multiple indicator signals into a unified trading signal.
@@ -250,17 +354,17 @@ def calculate_price_targets(
             "stop_loss": None
         }
     
-    # Calculate recent volatility (20-day)
-    recent_prices = [p.close for p in price_data[-20:]]
+    # The fixed 20-day window is sliced once and shared by every statistic below
+    recent = price_data[-20:]
+    
+    # Calculate recent volatility (mean absolute deviation relative to the average close)
+    recent_prices = [p.close for p in recent]
     avg_price = sum(recent_prices) / len(recent_prices)
     volatility = sum(abs(p - avg_price) for p in recent_prices) / len(recent_prices) / avg_price
     
     # Calculate support and resistance levels
-    highs = [p.high for p in price_data[-20:]]
-    lows = [p.low for p in price_data[-20:]]
-    
-    resistance = max(highs)
-    support = min(lows)
+    resistance = max(p.high for p in recent)
+    support = min(p.low for p in recent)
     
     entry_price = current_price
     target_price = None
@@ -319,31 +423,21 @@ async def perform_technical_analysis_internal(
             logger.warning(f"No price data available for {ticker}")
             return None
         
-        # Calculate indicators concurrently
-        indicator_tasks = []
-        for indicator in indicators:
-            # Set default parameters for each indicator
-            params = {}
-            if indicator == "RSI":
-                params = {"period": 14}
-            elif indicator in ["SMA", "EMA"]:
-                params = {"period": 20}
-            elif indicator == "MACD":
-                params = {"fast_period": 12, "slow_period": 26, "signal_period": 9}
-            elif indicator == "BB":
-                params = {"period": 20, "std_dev": 2.0}
-            
-            task = calculate_technical_indicator(price_data.data, indicator, params)
-            indicator_tasks.append(task)
-        
-        indicator_results = await asyncio.gather(*indicator_tasks, return_exceptions=True)
+        # Calculate every indicator in one round-trip; results keep request order
+        indicator_specs = [
+            {"name": indicator, "params": dict(DEFAULT_INDICATOR_PARAMS.get(indicator, {}))}
+            for indicator in indicators
+        ]
+        indicator_results = await calculate_technical_indicators(
+            to_price_points(price_data.data), indicator_specs
+        ) or []
         
         # Filter successful results
         valid_results = []
         indicator_values = {}
         
         for i, result in enumerate(indicator_results):
-            if isinstance(result, dict) and result:
+            if isinstance(result, dict) and result and "error" not in result:
                 valid_results.append(result)
                 indicator_name = indicators[i]
                 
@@ -352,8 +446,8 @@ async def perform_technical_analysis_internal(
                     indicator_values[indicator_name] = result["values"]
                 elif "components" in result:
                     indicator_values[indicator_name] = result["components"]
-            elif isinstance(result, Exception):
-                logger.warning(f"Indicator calculation failed: {result}")
+            elif isinstance(result, dict) and "error" in result:
+                logger.warning(f"Indicator calculation failed for {indicators[i]}: {result['error']}")
         
         if not valid_results:
             logger.warning(f"No valid indicator results for {ticker}")
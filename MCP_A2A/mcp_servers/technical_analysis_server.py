@@ -2,15 +2,33 @@
 TechnicalAnalysisMCP Server - Provides technical indicator calculations and signal generation.
 """
 
-from typing import Dict, List, Optional
-import math
-from fastapi import FastAPI, HTTPException
+from functools import cached_property, lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+import json
+import numpy as np
+from fastapi import FastAPI, HTTPException, Request
 from pydantic import BaseModel, Field
 
 from ..models.market_data import TechnicalIndicator
 from ..utils.logging_config import setup_logging, get_logger
 from ..config import PORTS
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the recurrences then run as plain Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse as IndicatorResponse
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional; responses then use the standard JSON encoder
+    from fastapi.responses import JSONResponse as IndicatorResponse
+    _json_loads = json.loads
+
 # Initialize logging
 setup_logging("technical_analysis_mcp")
 logger = get_logger(__name__)
@@ -18,7 +36,8 @@ logger = get_logger(__name__)
 app = FastAPI(
     title="TechnicalAnalysis MCP Server",
     description="Provides technical indicator calculations and signal generation",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=IndicatorResponse
 )
 
 # Request models
@@ -35,18 +54,156 @@ class IndicatorRequest(BaseModel):
     indicator_name: str = Field(..., description="Indicator name (RSI, SMA, EMA, MACD, BB)")
     params: Dict = Field(default_factory=dict, description="Indicator parameters")
 
+class IndicatorSpec(BaseModel):
+    """Single indicator within a batch request."""
+    name: str = Field(..., description="Indicator name (RSI, SMA, EMA, MACD, BB)")
+    params: Dict = Field(default_factory=dict, description="Indicator parameters")
+
+class BatchIndicatorRequest(BaseModel):
+    """Request for several indicators over the same price data."""
+    price_data: List[PricePoint] = Field(..., min_items=1, description="Historical price data")
+    indicators: List[IndicatorSpec] = Field(..., min_items=1, description="Indicators to calculate")
+
+
+@njit(cache=True)
+def _ema_core(prices: np.ndarray, period: int) -> np.ndarray:
+    """EMA recurrence seeded with the SMA of the first period."""
+    multiplier = 2.0 / (period + 1)
+    out = np.empty(len(prices) - period + 1)
+    ema = prices[:period].mean()
+    out[0] = ema
+    for i in range(period, len(prices)):
+        ema = prices[i] * multiplier + ema * (1.0 - multiplier)
+        out[i - period + 1] = ema
+    return out
+
+
+@njit(cache=True)
+def _rsi_core(gains: np.ndarray, losses: np.ndarray, period: int) -> np.ndarray:
+    """RSI from Wilder-smoothed average gains and losses."""
+    out = np.empty(len(gains) - period + 1)
+    avg_gain = gains[:period].mean()
+    avg_loss = losses[:period].mean()
+    for i in range(period - 1, len(gains)):
+        if i >= period:
+            avg_gain = (avg_gain * (period - 1) + gains[i]) / period
+            avg_loss = (avg_loss * (period - 1) + losses[i]) / period
+        if avg_loss == 0:
+            out[i - period + 1] = 100.0
+        else:
+            out[i - period + 1] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    return out
+
+
+@njit(cache=True)
+def _macd_core(prices: np.ndarray, fast_period: int, slow_period: int, signal_period: int):
+    """MACD line, signal line and histogram in one pass over the prices."""
+    n_macd = len(prices) - slow_period + 1
+    n_signal = max(n_macd - signal_period + 1, 0)
+    macd = np.empty(n_macd)
+    signal = np.empty(n_signal)
+    histogram = np.empty(n_signal)
+    
+    fast_mult = 2.0 / (fast_period + 1)
+    slow_mult = 2.0 / (slow_period + 1)
+    signal_mult = 2.0 / (signal_period + 1)
+    
+    # Each EMA is seeded with the SMA of its first period
+    fast_sum = 0.0
+    slow_sum = 0.0
+    signal_sum = 0.0
+    ema_fast = 0.0
+    ema_slow = 0.0
+    ema_signal = 0.0
+    
+    for i in range(len(prices)):
+        price = prices[i]
+        if i < fast_period:
+            fast_sum += price
+            ema_fast = fast_sum / fast_period
+        else:
+            ema_fast = price * fast_mult + ema_fast * (1.0 - fast_mult)
+        if i < slow_period:
+            slow_sum += price
+            ema_slow = slow_sum / slow_period
+        else:
+            ema_slow = price * slow_mult + ema_slow * (1.0 - slow_mult)
+        
+        j = i - slow_period + 1
+        if j < 0:
+            continue
+        macd_value = ema_fast - ema_slow
+        macd[j] = macd_value
+        
+        if j < signal_period:
+            signal_sum += macd_value
+            ema_signal = signal_sum / signal_period
+        else:
+            ema_signal = macd_value * signal_mult + ema_signal * (1.0 - signal_mult)
+        
+        k = j - signal_period + 1
+        if k >= 0:
+            signal[k] = ema_signal
+            histogram[k] = macd_value - ema_signal
+    
+    return macd, signal, histogram
+
+
+def _prefix_sum(values: np.ndarray) -> np.ndarray:
+    """Cumulative sum with a leading zero, written into one preallocated array."""
+    out = np.empty(len(values) + 1)
+    out[0] = 0.0
+    np.cumsum(values, out=out[1:])
+    return out
+
+
+class PriceContext:
+    """
+    Closing prices of one request with derived arrays shared across indicators.
+    
+    The derived arrays are computed on first use. Contexts compare equal when
+    their closes are identical, so they can key the indicator result cache.
+    """
+    
+    def __init__(self, closes: np.ndarray):
+        self.closes = closes
+        self.key = closes.tobytes()
+    
+    def __hash__(self) -> int:
+        return hash(self.key)
+    
+    def __eq__(self, other) -> bool:
+        return isinstance(other, PriceContext) and self.key == other.key
+    
+    @cached_property
+    def cumsum(self) -> np.ndarray:
+        """Cumulative sum of closes with a leading zero."""
+        return _prefix_sum(self.closes)
+    
+    @cached_property
+    def cumsum_sq(self) -> np.ndarray:
+        """Cumulative sum of squared closes with a leading zero."""
+        return _prefix_sum(self.closes * self.closes)
+    
+    @cached_property
+    def diff(self) -> np.ndarray:
+        """Bar-to-bar price changes."""
+        return np.diff(self.closes)
+
 
-def calculate_sma(prices: List[float], period: int) -> List[float]:
+def calculate_sma(prices: List[float], period: int, ctx: Optional[PriceContext] = None) -> List[float]:
     """Calculate Simple Moving Average."""
     if len(prices) < period:
         return []
     
-    sma_values = []
-    for i in range(period - 1, len(prices)):
-        avg = sum(prices[i - period + 1:i + 1]) / period
-        sma_values.append(round(avg, 4))
+    # Window sums are differences of one cumulative sum
+    if ctx is not None:
+        cumulative = ctx.cumsum
+    else:
+        cumulative = _prefix_sum(np.asarray(prices, dtype=np.float64))
+    sma_values = (cumulative[period:] - cumulative[:-period]) / period
     
-    return sma_values
+    return np.round(sma_values, 4).tolist()
 
 
 def calculate_ema(prices: List[float], period: int) -> List[float]:
@@ -54,62 +211,24 @@ def calculate_ema(prices: List[float], period: int) -> List[float]:
     if len(prices) < period:
         return []
     
-    ema_values = []
-    multiplier = 2 / (period + 1)
-    
-    # Start with SMA for first value
-    sma = sum(prices[:period]) / period
-    ema_values.append(round(sma, 4))
+    ema_values = _ema_core(np.asarray(prices, dtype=np.float64), period)
     
-    # Calculate EMA for remaining values
-    for i in range(period, len(prices)):
-        ema = (prices[i] * multiplier) + (ema_values[-1] * (1 - multiplier))
-        ema_values.append(round(ema, 4))
-    
-    return ema_values
+    return np.round(ema_values, 4).tolist()
 
 
-def calculate_rsi(prices: List[float], period: int = 14) -> List[float]:
+def calculate_rsi(prices: List[float], period: int = 14, ctx: Optional[PriceContext] = None) -> List[float]:
     """Calculate Relative Strength Index."""
     if len(prices) < period + 1:
         return []
     
-    # Calculate price changes
-    changes = []
-    for i in range(1, len(prices)):
-        changes.append(prices[i] - prices[i-1])
-    
-    # Separate gains and losses
-    gains = [max(change, 0) for change in changes]
-    losses = [abs(min(change, 0)) for change in changes]
+    # Split price changes into gains and losses
+    changes = ctx.diff if ctx is not None else np.diff(np.asarray(prices, dtype=np.float64))
+    gains = np.maximum(changes, 0.0)
+    losses = np.maximum(-changes, 0.0)
     
-    rsi_values = []
+    rsi_values = _rsi_core(gains, losses, period)
     
-    # Calculate initial average gain and loss
-    avg_gain = sum(gains[:period]) / period
-    avg_loss = sum(losses[:period]) / period
-    
-    # Calculate first RSI value
-    if avg_loss == 0:
-        rsi_values.append(100.0)
-    else:
-        rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs))
-        rsi_values.append(round(rsi, 2))
-    
-    # Calculate remaining RSI values using smoothed averages
-    for i in range(period, len(changes)):
-        avg_gain = ((avg_gain * (period - 1)) + gains[i]) / period
-        avg_loss = ((avg_loss * (period - 1)) + losses[i]) / period
-        
-        if avg_loss == 0:
-            rsi_values.append(100.0)
-        else:
-            rs = avg_gain / avg_loss
-            rsi = 100 - (100 / (1 + rs))
-            rsi_values.append(round(rsi, 2))
-    
-    return rsi_values
+    return np.round(rsi_values, 2).tolist()
 
 
 def calculate_macd(prices: List[float], fast_period: int = 12, slow_period: int = 26, signal_period: int = 9) -> Dict:
@@ -117,60 +236,45 @@ def calculate_macd(prices: List[float], fast_period: int = 12, slow_period: int
     if len(prices) < slow_period:
         return {"macd": [], "signal": [], "histogram": []}
     
-    # Calculate EMAs
-    ema_fast = calculate_ema(prices, fast_period)
-    ema_slow = calculate_ema(prices, slow_period)
-    
-    # Align EMAs (slow EMA starts later)
-    start_index = slow_period - fast_period
-    ema_fast_aligned = ema_fast[start_index:]
-    
-    # Calculate MACD line
-    macd_line = []
-    for i in range(len(ema_slow)):
-        macd_value = ema_fast_aligned[i] - ema_slow[i]
-        macd_line.append(round(macd_value, 4))
-    
-    # Calculate signal line (EMA of MACD)
-    signal_line = calculate_ema(macd_line, signal_period)
-    
-    # Calculate histogram (MACD - Signal)
-    histogram = []
-    signal_start = len(macd_line) - len(signal_line)
-    for i in range(len(signal_line)):
-        hist_value = macd_line[signal_start + i] - signal_line[i]
-        histogram.append(round(hist_value, 4))
+    macd_line, signal_line, histogram = _macd_core(
+        np.asarray(prices, dtype=np.float64), fast_period, slow_period, signal_period
+    )
     
     return {
-        "macd": macd_line,
-        "signal": signal_line,
-        "histogram": histogram
+        "macd": np.round(macd_line, 4).tolist(),
+        "signal": np.round(signal_line, 4).tolist(),
+        "histogram": np.round(histogram, 4).tolist()
     }
 
 
-def calculate_bollinger_bands(prices: List[float], period: int = 20, std_dev: float = 2.0) -> Dict:
+def calculate_bollinger_bands(
+    prices: List[float],
+    period: int = 20,
+    std_dev: float = 2.0,
+    ctx: Optional[PriceContext] = None
+) -> Dict:
     """Calculate Bollinger Bands."""
     if len(prices) < period:
         return {"upper": [], "middle": [], "lower": []}
     
-    middle_band = calculate_sma(prices, period)
-    upper_band = []
-    lower_band = []
+    # Window mean and population variance from cumulative sums of price
+    # and squared price
+    if ctx is not None:
+        cumulative = ctx.cumsum
+        cumulative_sq = ctx.cumsum_sq
+    else:
+        arr = np.asarray(prices, dtype=np.float64)
+        cumulative = _prefix_sum(arr)
+        cumulative_sq = _prefix_sum(arr * arr)
     
-    for i in range(period - 1, len(prices)):
-        # Calculate standard deviation for the period
-        price_slice = prices[i - period + 1:i + 1]
-        mean = sum(price_slice) / period
-        variance = sum((p - mean) ** 2 for p in price_slice) / period
-        std = math.sqrt(variance)
-        
-        # Calculate bands
-        middle = middle_band[i - period + 1]
-        upper = middle + (std_dev * std)
-        lower = middle - (std_dev * std)
-        
-        upper_band.append(round(upper, 4))
-        lower_band.append(round(lower, 4))
+    middle = (cumulative[period:] - cumulative[:-period]) / period
+    variance = (cumulative_sq[period:] - cumulative_sq[:-period]) / period - middle * middle
+    std = np.sqrt(np.maximum(variance, 0.0))
+    
+    # Calculate bands
+    upper_band = np.round(middle + std_dev * std, 4).tolist()
+    middle_band = np.round(middle, 4).tolist()
+    lower_band = np.round(middle - std_dev * std, 4).tolist()
     
     return {
         "upper": upper_band,
@@ -179,98 +283,87 @@ def calculate_bollinger_bands(prices: List[float], period: int = 20, std_dev: fl
     }
 
 
+_HOLD = ("HOLD", 0.0, "")
+
+
+def _rsi_signal(values: List[float], prices: Sequence[float], params: Dict) -> Tuple[str, float, str]:
+    """RSI overbought/oversold signal."""
+    latest_value = values[-1]
+    if latest_value > 70:
+        return "SELL", min((latest_value - 70) / 20, 1.0), f"RSI overbought at {latest_value}"  # Scale 70-90 to 0-1
+    if latest_value < 30:
+        return "BUY", min((30 - latest_value) / 20, 1.0), f"RSI oversold at {latest_value}"  # Scale 30-10 to 0-1
+    return "HOLD", 0.0, f"RSI neutral at {latest_value}"
+
+
+def _average_signal(label: str, band: float, scale: float):
+    """Signal on the latest price moving more than ``band`` away from a moving average."""
+    def handler(values: List[float], prices: Sequence[float], params: Dict) -> Tuple[str, float, str]:
+        if len(prices) < len(values):
+            return _HOLD
+        current_price = prices[-1]
+        average = values[-1]
+        
+        if current_price > average * (1 + band):
+            return "BUY", min((current_price - average) / average / scale, 1.0), f"Price {current_price} above {label} {average}"
+        if current_price < average * (1 - band):
+            return "SELL", min((average - current_price) / average / scale, 1.0), f"Price {current_price} below {label} {average}"
+        return "HOLD", 0.0, f"Price {current_price} near {label} {average}"
+    
+    return handler
+
+
+def _macd_signal(values: Dict, prices: Sequence[float], params: Dict) -> Tuple[str, float, str]:
+    """Signal on the MACD histogram crossing zero."""
+    if not isinstance(values, dict) or len(values.get("histogram", [])) < 2:
+        return _HOLD
+    current_hist = values["histogram"][-1]
+    prev_hist = values["histogram"][-2]
+    
+    # Scale confidence based on histogram value
+    if current_hist > 0 and prev_hist <= 0:
+        return "BUY", min(abs(current_hist) / 0.5, 1.0), "MACD histogram crossed above zero"
+    if current_hist < 0 and prev_hist >= 0:
+        return "SELL", min(abs(current_hist) / 0.5, 1.0), "MACD histogram crossed below zero"
+    return "HOLD", 0.0, f"MACD histogram at {current_hist}"
+
+
+def _bollinger_signal(values: Dict, prices: Sequence[float], params: Dict) -> Tuple[str, float, str]:
+    """Signal on the latest price touching a Bollinger Band."""
+    if not isinstance(values, dict) or len(prices) == 0:
+        return _HOLD
+    upper = values.get("upper", [])
+    lower = values.get("lower", [])
+    if not upper or not lower:
+        return _HOLD
+    current_price = prices[-1]
+    upper_band = upper[-1]
+    lower_band = lower[-1]
+    
+    if current_price >= upper_band:
+        return "SELL", min((current_price - upper_band) / upper_band / 0.02, 1.0), f"Price {current_price} at upper Bollinger Band {upper_band}"
+    if current_price <= lower_band:
+        return "BUY", min((lower_band - current_price) / lower_band / 0.02, 1.0), f"Price {current_price} at lower Bollinger Band {lower_band}"
+    return "HOLD", 0.0, f"Price {current_price} within Bollinger Bands"
+
+
+# Signal handler per indicator; each returns (signal, confidence, reason)
+_SIGNAL_DISPATCH = {
+    "RSI": _rsi_signal,
+    "SMA": _average_signal("SMA", band=0.02, scale=0.05),  # 2% band, confidence scaled to 5% max
+    "EMA": _average_signal("EMA", band=0.015, scale=0.03),  # 1.5% band, confidence scaled to 3% max
+    "MACD": _macd_signal,
+    "BB": _bollinger_signal,
+}
+
+
 def generate_signal(indicator_name: str, values: List[float], prices: List[float], params: Dict) -> Dict:
     """Generate trading signals based on indicator values."""
     if not values or len(values) == 0:
         return {"signal": "HOLD", "confidence": 0.0, "reason": "Insufficient data"}
     
-    latest_value = values[-1]
-    signal = "HOLD"
-    confidence = 0.0
-    reason = ""
-    
-    if indicator_name.upper() == "RSI":
-        if latest_value > 70:
-            signal = "SELL"
-            confidence = min((latest_value - 70) / 20, 1.0)  # Scale 70-90 to 0-1
-            reason = f"RSI overbought at {latest_value}"
-        elif latest_value < 30:
-            signal = "BUY"
-            confidence = min((30 - latest_value) / 20, 1.0)  # Scale 30-10 to 0-1
-            reason = f"RSI oversold at {latest_value}"
-        else:
-            reason = f"RSI neutral at {latest_value}"
-    
-    elif indicator_name.upper() == "SMA":
-        if len(prices) >= len(values):
-            current_price = prices[-1]
-            sma_value = latest_value
-            
-            if current_price > sma_value * 1.02:  # 2% above SMA
-                signal = "BUY"
-                confidence = min((current_price - sma_value) / sma_value / 0.05, 1.0)  # Scale to 5% max
-                reason = f"Price {current_price} above SMA {sma_value}"
-            elif current_price < sma_value * 0.98:  # 2% below SMA
-                signal = "SELL"
-                confidence = min((sma_value - current_price) / sma_value / 0.05, 1.0)
-                reason = f"Price {current_price} below SMA {sma_value}"
-            else:
-                reason = f"Price {current_price} near SMA {sma_value}"
-    
-    elif indicator_name.upper() == "EMA":
-        if len(prices) >= len(values):
-            current_price = prices[-1]
-            ema_value = latest_value
-            
-            if current_price > ema_value * 1.015:  # 1.5% above EMA
-                signal = "BUY"
-                confidence = min((current_price - ema_value) / ema_value / 0.03, 1.0)
-                reason = f"Price {current_price} above EMA {ema_value}"
-            elif current_price < ema_value * 0.985:  # 1.5% below EMA
-                signal = "SELL"
-                confidence = min((ema_value - current_price) / ema_value / 0.03, 1.0)
-                reason = f"Price {current_price} below EMA {ema_value}"
-            else:
-                reason = f"Price {current_price} near EMA {ema_value}"
-    
-    elif indicator_name.upper() == "MACD":
-        if isinstance(values, dict) and "histogram" in values:
-            histogram = values["histogram"]
-            if len(histogram) >= 2:
-                current_hist = histogram[-1]
-                prev_hist = histogram[-2]
-                
-                if current_hist > 0 and prev_hist <= 0:
-                    signal = "BUY"
-                    confidence = min(abs(current_hist) / 0.5, 1.0)  # Scale based on histogram value
-                    reason = "MACD histogram crossed above zero"
-                elif current_hist < 0 and prev_hist >= 0:
-                    signal = "SELL"
-                    confidence = min(abs(current_hist) / 0.5, 1.0)
-                    reason = "MACD histogram crossed below zero"
-                else:
-                    reason = f"MACD histogram at {current_hist}"
-    
-    elif indicator_name.upper() == "BB":
-        if isinstance(values, dict) and len(prices) > 0:
-            upper = values.get("upper", [])
-            lower = values.get("lower", [])
-            
-            if upper and lower:
-                current_price = prices[-1]
-                upper_band = upper[-1]
-                lower_band = lower[-1]
-                
-                if current_price >= upper_band:
-                    signal = "SELL"
-                    confidence = min((current_price - upper_band) / upper_band / 0.02, 1.0)
-                    reason = f"Price {current_price} at upper Bollinger Band {upper_band}"
-                elif current_price <= lower_band:
-                    signal = "BUY"
-                    confidence = min((lower_band - current_price) / lower_band / 0.02, 1.0)
-                    reason = f"Price {current_price} at lower Bollinger Band {lower_band}"
-                else:
-                    reason = f"Price {current_price} within Bollinger Bands"
+    handler = _SIGNAL_DISPATCH.get(indicator_name.upper())
+    signal, confidence, reason = handler(values, prices, params) if handler else _HOLD
     
     return {
         "signal": signal,
@@ -279,6 +372,131 @@ def generate_signal(indicator_name: str, values: List[float], prices: List[float
     }
 
 
+def compute_indicator(
+    indicator_name: str,
+    prices: Sequence[float],
+    params: Dict,
+    ctx: Optional[PriceContext] = None
+):
+    """Calculate the named indicator over ``prices``; raises ValueError if unsupported."""
+    # Calculate indicator based on type
+    if indicator_name == "SMA":
+        period = params.get("period", 20)
+        values = calculate_sma(prices, period, ctx)
+        
+    elif indicator_name == "EMA":
+        period = params.get("period", 20)
+        values = calculate_ema(prices, period)
+        
+    elif indicator_name == "RSI":
+        period = params.get("period", 14)
+        values = calculate_rsi(prices, period, ctx)
+        
+    elif indicator_name == "MACD":
+        fast_period = params.get("fast_period", 12)
+        slow_period = params.get("slow_period", 26)
+        signal_period = params.get("signal_period", 9)
+        values = calculate_macd(prices, fast_period, slow_period, signal_period)
+        
+    elif indicator_name == "BB":
+        period = params.get("period", 20)
+        std_dev = params.get("std_dev", 2.0)
+        values = calculate_bollinger_bands(prices, period, std_dev, ctx)
+        
+    else:
+        raise ValueError(f"Unsupported indicator: {indicator_name}")
+    
+    return values
+
+
+@lru_cache(maxsize=1024)
+def _cached_indicator(indicator_name: str, params_key: str, ctx: PriceContext) -> Tuple:
+    """Indicator values and trading signal, memoised on the exact request inputs."""
+    params = json.loads(params_key)
+    prices = ctx.closes
+    values = compute_indicator(indicator_name, prices, params, ctx)
+    
+    # Generate trading signal
+    signal_info = generate_signal(indicator_name, values, prices, params)
+    
+    return values, signal_info
+
+
+def extract_closes(price_data: List[PricePoint]) -> np.ndarray:
+    """Closing prices of the request as a float64 array."""
+    return np.fromiter(
+        (point.close for point in price_data),
+        dtype=np.float64,
+        count=len(price_data)
+    )
+
+
+def build_indicator_result(indicator_name: str, params: Dict, ctx: PriceContext) -> Dict:
+    """
+    Calculate one indicator and shape it into the response dictionary.
+    
+    Args:
+        indicator_name: Upper-case indicator name
+        params: Indicator parameters
+        ctx: Price context of the request
+        
+    Returns:
+        Dictionary containing indicator values and trading signal
+    """
+    # Identical requests (same prices, indicator and params) reuse the cached result
+    params_key = json.dumps(params, sort_keys=True)
+    values, signal_info = _cached_indicator(indicator_name, params_key, ctx)
+    
+    result = TechnicalIndicator(
+        indicator=indicator_name,
+        values=values if isinstance(values, list) else [values],
+        signal=signal_info["signal"],
+        confidence=signal_info["confidence"],
+        parameters=params
+    )
+    
+    # Add signal reason to result
+    result_dict = result.dict()
+    result_dict["signal_reason"] = signal_info["reason"]
+    
+    # For complex indicators, include all components
+    if isinstance(values, dict):
+        result_dict["components"] = values
+        result_dict["values"] = []  # Clear simple values for complex indicators
+    
+    logger.info(f"Generated {indicator_name} signal: {signal_info['signal']} (confidence: {signal_info['confidence']})")
+    
+    return result_dict
+
+
+def build_batch_results(ctx: PriceContext, specs: List[Tuple[str, Dict]]) -> List[Dict]:
+    """
+    Calculate each requested indicator over one price context.
+    
+    Args:
+        ctx: Price context shared by every indicator
+        specs: (indicator name, params) pairs in request order
+        
+    Returns:
+        One result per spec; indicators that fail yield an entry with an "error" message
+    """
+    logger.info(f"Calculating {len(specs)} indicators for {len(ctx.closes)} price points")
+    
+    results = []
+    for name, params in specs:
+        indicator_name = name.upper()
+        try:
+            results.append(build_indicator_result(indicator_name, params, ctx))
+        except ValueError as e:
+            logger.warning(f"Invalid indicator in batch request: {e}")
+            results.append({"indicator": indicator_name, "error": str(e)})
+        except Exception as e:
+            logger.error(f"Error calculating {indicator_name} in batch request: {e}")
+            results.append({"indicator": indicator_name, "error": "Internal server error"})
+    
+    return results
+
+
 @app.get("/")
 async def root():
     """Health check endpoint."""
@@ -298,66 +516,78 @@ async def calculate_indicator(request: IndicatorRequest) -> Dict:
     """
     try:
         indicator_name = request.indicator_name.upper()
-        prices = [point.close for point in request.price_data]
+        # Closes are extracted once; every indicator works on this array
+        prices = extract_closes(request.price_data)
         
         logger.info(f"Calculating {indicator_name} for {len(prices)} price points")
         
-        # Calculate indicator based on type
-        if indicator_name == "SMA":
-            period = request.params.get("period", 20)
-            values = calculate_sma(prices, period)
-            
-        elif indicator_name == "EMA":
-            period = request.params.get("period", 20)
-            values = calculate_ema(prices, period)
-            
-        elif indicator_name == "RSI":
-            period = request.params.get("period", 14)
-            values = calculate_rsi(prices, period)
-            
-        elif indicator_name == "MACD":
-            fast_period = request.params.get("fast_period", 12)
-            slow_period = request.params.get("slow_period", 26)
-            signal_period = request.params.get("signal_period", 9)
-            values = calculate_macd(prices, fast_period, slow_period, signal_period)
-            
-        elif indicator_name == "BB":
-            period = request.params.get("period", 20)
-            std_dev = request.params.get("std_dev", 2.0)
-            values = calculate_bollinger_bands(prices, period, std_dev)
-            
-        else:
-            raise ValueError(f"Unsupported indicator: {indicator_name}")
+        return build_indicator_result(indicator_name, request.params, PriceContext(prices))
         
-        # Generate trading signal
-        signal_info = generate_signal(indicator_name, values, prices, request.params)
-        
-        result = TechnicalIndicator(
-            indicator=indicator_name,
-            values=values if isinstance(values, list) else [values],
-            signal=signal_info["signal"],
-            confidence=signal_info["confidence"],
-            parameters=request.params
-        )
+    except ValueError as e:
+        logger.error(f"Invalid indicator request: {e}")
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error calculating indicator: {e}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@app.post("/mcp/calculate_indicators")
+async def calculate_indicators(request: BatchIndicatorRequest) -> Dict:
+    """
+    Calculate several technical indicators over the same price data.
+    
+    Args:
+        request: Batch indicator calculation request
         
-        # Add signal reason to result
-        result_dict = result.dict()
-        result_dict["signal_reason"] = signal_info["reason"]
+    Returns:
+        Dictionary with one result per requested indicator, in request order.
+        Indicators that fail yield an entry with an "error" message.
+    """
+    try:
+        # One context per request, so indicators share cumulative sums and price changes
+        ctx = PriceContext(extract_closes(request.price_data))
+        specs = [(spec.name, spec.params) for spec in request.indicators]
         
-        # For complex indicators, include all components
-        if isinstance(values, dict):
-            result_dict["components"] = values
-            result_dict["values"] = []  # Clear simple values for complex indicators
+        return {"results": build_batch_results(ctx, specs)}
         
-        logger.info(f"Generated {indicator_name} signal: {signal_info['signal']} (confidence: {signal_info['confidence']})")
+    except Exception as e:
+        logger.error(f"Error calculating indicators: {e}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@app.post("/mcp/calculate_indicators_fast")
+async def calculate_indicators_fast(request: Request) -> Dict:
+    """
+    Calculate several technical indicators for trusted internal callers.
+    
+    Takes the same body as /mcp/calculate_indicators but reads it directly,
+    skipping per-price-point model validation. External clients should use
+    the validated endpoint.
+    
+    Args:
+        request: Raw HTTP request
         
-        return result_dict
+    Returns:
+        Dictionary with one result per requested indicator, in request order
+    """
+    try:
+        data = _json_loads(await request.body())
+        price_data = data["price_data"]
+        closes = np.fromiter(
+            (point["close"] for point in price_data),
+            dtype=np.float64,
+            count=len(price_data)
+        )
+        specs = [(spec["name"], spec.get("params") or {}) for spec in data["indicators"]]
+    except (ValueError, KeyError, TypeError) as e:
+        logger.error(f"Invalid fast indicator request: {e}")
+        raise HTTPException(status_code=400, detail=f"Invalid request body: {e}")
+    
+    try:
+        return {"results": build_batch_results(PriceContext(closes), specs)}
         
-    except ValueError as e:
-        logger.error(f"Invalid indicator request: {e}")
-        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        logger.error(f"Error calculating indicator: {e}")
+        logger.error(f"Error calculating indicators: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
@@ -54,6 +54,7 @@ setup(
             "pytest-asyncio>=0.21.0",
             "pytest-cov>=4.1.0",
             "pytest-mock>=3.12.0",
+            "pytest-xdist>=3.5.0",
             "httpx-mock>=0.7.0",
         ],
         "docs": [
@@ -66,6 +67,10 @@ setup(
             "prometheus-client>=0.19.0",
             "opentelemetry-api>=1.21.0",
             "opentelemetry-sdk>=1.21.0",
+        ],
+        "performance": [
+            "numba>=0.58.0",
+            "orjson>=3.9.0",
         ]
     },
     entry_points={
@@ -0,0 +1,54 @@
+"""
+Shared pytest fixtures for MCP A2A Trading System tests.
+"""
+
+import asyncio
+import os
+
+import httpx
+import pytest
+
+# Must be set before any application module imports pydantic
+os.environ.setdefault("PYDANTIC_DISABLE_PLUGINS", "1")
+
+
+def pytest_addoption(parser):
+    """Add the opt-in flag for tests that need the live services."""
+    parser.addoption(
+        "--run-integration",
+        action="store_true",
+        default=False,
+        help="run tests marked integration against the running services"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip integration tests unless --run-integration is given."""
+    if config.getoption("--run-integration"):
+        return
+    
+    skip_integration = pytest.mark.skip(reason="needs --run-integration and the live services")
+    for item in items:
+        if "integration" in item.keywords:
+            item.add_marker(skip_integration)
+
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """Share a single event loop across the whole test session."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="session")
+async def http_client():
+    """HTTP client with a keep-alive pool reused by every test in the session."""
+    client = httpx.AsyncClient(
+        timeout=30.0,
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64)
+    )
+    try:
+        yield client
+    finally:
+        await client.aclose()
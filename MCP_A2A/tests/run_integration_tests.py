@@ -223,6 +223,7 @@ class IntegrationTestRunner:
                     "MCP_A2A/tests/test_integration_workflows.py",
                     "-v",
                     "--tb=short",
+                    "--run-integration",
                     "--maxfail=5",
                     "-x"  # Stop on first failure for faster feedback
                 ]
@@ -3,7 +3,9 @@ Configuration for integration tests.
 """
 
 import os
-from typing import Dict, Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
 
 # Test configuration
 TEST_CONFIG = {
@@ -101,14 +103,21 @@ if os.getenv("TEST_ENV") == "local":
     TEST_CONFIG["performance_thresholds"]["max_concurrent_requests"] = 3
 
 
-def get_test_config() -> Dict[str, Any]:
-    """Get the current test configuration."""
-    return TEST_CONFIG
+@lru_cache(maxsize=None)
+def get_test_config() -> Mapping[str, Any]:
+    """Get a read-only view of the current test configuration."""
+    return MappingProxyType(TEST_CONFIG)
 
 
-def get_test_strategy(strategy_name: str) -> Dict[str, Any]:
-    """Get a specific test strategy by name."""
-    return TEST_CONFIG["test_strategies"].get(strategy_name, {})
+@lru_cache(maxsize=None)
+def get_test_strategy(strategy_name: str) -> Mapping[str, Any]:
+    """
+    Get a read-only view of a specific test strategy by name.
+    
+    The view is shared across tests; pass ``dict(strategy)`` where a
+    mutable copy or a JSON body is needed.
+    """
+    return MappingProxyType(TEST_CONFIG["test_strategies"].get(strategy_name, {}))
 
 
 def get_performance_threshold(threshold_name: str) -> float:
@@ -19,6 +19,9 @@ from MCP_A2A.models.trading_models import InvestmentStrategy, TradeProposal
 from MCP_A2A.utils.a2a_client import A2AClient
 from MCP_A2A.tests.test_config import get_test_config, get_test_strategy
 
+# Every test here drives the running services end to end
+pytestmark = pytest.mark.integration
+
 
 class IntegrationTestHelper:
     """Helper class for integration testing with service management."""
@@ -120,7 +123,7 @@ class TestCompleteWorkflows:
         
         response = await integration_helper.client.post(
             f"{SERVICE_URLS['portfolio_manager']}/start_strategy",
-            json=strategy
+            json=dict(strategy)
         )
         
         assert response.status_code == 200
@@ -164,7 +167,7 @@ class TestCompleteWorkflows:
         
         response = await integration_helper.client.post(
             f"{SERVICE_URLS['portfolio_manager']}/start_strategy",
-            json=strategy
+            json=dict(strategy)
         )
         
         assert response.status_code == 200
@@ -608,4 +611,4 @@ class TestDataConsistencyAndIntegrity:
 
 if __name__ == "__main__":
     # Run integration tests
-    pytest.main([__file__, "-v", "--tb=short"])
\ No newline at end of file
+    pytest.main([__file__, "-v", "--tb=short", "--run-integration"])
\ No newline at end of file
@@ -2,10 +2,13 @@
 Unit tests for RiskManager Agent.
 """
 
+from types import MappingProxyType
+
+import httpx
 import pytest
-from fastapi.testclient import TestClient
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock
 
+from ..agents import risk_manager_agent
 from ..agents.risk_manager_agent import (
     app, evaluate_position_size_risk, evaluate_cash_reserve_risk,
     evaluate_diversification_risk, evaluate_trade_quality_risk,
@@ -14,25 +17,141 @@ from ..agents.risk_manager_agent import (
 from ..models.trading_models import TradeProposal, TradeAction
 
 
+def _proposal(ticker, action, quantity, price, rationale, **extra):
+    """Build a trade proposal, defaulting to medium risk."""
+    extra.setdefault("risk_level", "medium")
+    return TradeProposal(
+        ticker=ticker,
+        action=action,
+        quantity=quantity,
+        estimated_price=price,
+        rationale=rationale,
+        **extra
+    )
+
+
+# Trade proposals are never mutated, so validate them once at import time
+_BUY_MSFT = _proposal("MSFT", TradeAction.BUY, 25, 400.0, "Strong technical signals")  # $10,000
+_LARGE_EXPENSIVE = _proposal("EXPENSIVE", TradeAction.BUY, 100, 200.0, "Large position")  # $20,000
+_LARGE_PERCENTAGE = _proposal("NEWSTOCK", TradeAction.BUY, 30, 400.0, "Large percentage position")  # 12%
+_ADD_TO_AAPL = _proposal("AAPL", TradeAction.BUY, 20, 150.0, "Adding to position")  # +$3,000
+_APPROACHING_LIMIT = _proposal("NEWSTOCK", TradeAction.BUY, 20, 400.0, "Approaching limit")  # 8%
+_SELL_AAPL = _proposal("AAPL", TradeAction.SELL, 25, 150.0, "Taking profits")
+
+_CASH_SUFFICIENT = _proposal("AAPL", TradeAction.BUY, 50, 150.0, "Good opportunity")  # $7,500
+_CASH_TOO_EXPENSIVE = _proposal("EXPENSIVE", TradeAction.BUY, 200, 150.0, "Too expensive")  # $30,000
+_CASH_LEAVES_LOW = _proposal("AAPL", TradeAction.BUY, 100, 150.0, "Leaves low cash")  # $15,000
+_CASH_APPROACHING_MINIMUM = _proposal("AAPL", TradeAction.BUY, 50, 100.0, "Approaching minimum")  # $5,000
+_CASH_SELL = _proposal("AAPL", TradeAction.SELL, 50, 150.0, "Taking profits")
+
+_NEW_POSITION = _proposal("NEWSTOCK", TradeAction.BUY, 50, 100.0, "New position")
+_TOO_MANY_POSITIONS = _proposal("ANOTHERSTOCK", TradeAction.BUY, 50, 100.0, "Too many positions")
+_ADD_TO_EXISTING = _proposal("STOCK1", TradeAction.BUY, 20, 100.0, "Adding to existing")
+
+
+def _quality_proposal(fundamental_score, technical_confidence, risk_level):
+    return _proposal(
+        "QUALITY", TradeAction.BUY, 50, 100.0, "Trade quality test",
+        fundamental_score=fundamental_score,
+        technical_confidence=technical_confidence,
+        risk_level=risk_level
+    )
+
+
+# Read-only holdings for the diversification tests
+_DIVERSIFIED_POSITIONS = tuple(
+    MappingProxyType({"ticker": f"STOCK{i}", "quantity": 10, "current_value": 5000.0})
+    for i in range(10)
+)
+_OVER_DIVERSIFIED_POSITIONS = tuple(  # Exceeds recommended maximum of 20
+    MappingProxyType({"ticker": f"STOCK{i}", "quantity": 10, "current_value": 2000.0})
+    for i in range(25)
+)
+
+_POSITION_SIZE_CASES = [
+    # (trade, passed, violation, warning)
+    pytest.param(_BUY_MSFT, True, None, None, id="within_limits"),
+    pytest.param(_LARGE_EXPENSIVE, False, "exceeds maximum single trade limit", None,
+                 id="exceeds_single_trade_limit"),
+    pytest.param(_LARGE_PERCENTAGE, False, "exceeding maximum", None,
+                 id="exceeds_portfolio_percentage"),
+    pytest.param(_ADD_TO_AAPL, False, "Total position in AAPL", None,
+                 id="adding_to_existing_position"),
+    pytest.param(_APPROACHING_LIMIT, True, None, "approaching maximum",
+                 id="approaching_limit_warning"),
+    # Sell orders don't increase position size
+    pytest.param(_SELL_AAPL, True, None, None, id="sell_order"),
+]
+
+_CASH_RESERVE_CASES = [
+    # (trade, passed, violation, min_remaining_pct)
+    pytest.param(_CASH_SUFFICIENT, True, None, 20, id="sufficient"),
+    pytest.param(_CASH_TOO_EXPENSIVE, False, "Insufficient cash", None, id="insufficient_cash"),
+    pytest.param(_CASH_LEAVES_LOW, False, "below minimum reserve", None, id="below_minimum"),
+    pytest.param(_CASH_APPROACHING_MINIMUM, True, None, None, id="approaching_minimum_warning"),
+    # Sell orders don't affect cash reserves negatively
+    pytest.param(_CASH_SELL, True, None, None, id="sell_order"),
+]
+
+_TRADE_QUALITY_CASES = [
+    # (trade, passed, violation, min_warnings)
+    pytest.param(_quality_proposal(85.0, 0.8, "low"), True, None, 0, id="high_scores"),
+    # Fundamental score below minimum of 30
+    pytest.param(_quality_proposal(20.0, 0.8, "medium"), False, "too low", 0,
+                 id="low_fundamental_score"),
+    # Technical confidence below minimum of 0.3
+    pytest.param(_quality_proposal(70.0, 0.2, "medium"), False, "too low", 0,
+                 id="low_technical_confidence"),
+    pytest.param(_quality_proposal(70.0, 0.7, "very high"), False, "very high risk", 0,
+                 id="high_risk_level"),
+    # Below average scores and high (not very high) risk warn for each
+    pytest.param(_quality_proposal(45.0, 0.4, "high"), True, None, 2, id="warnings"),
+]
+
+
+@pytest.fixture(scope="session")
+async def client():
+    """Create async test client shared across the session."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def sample_portfolio():
+    """Create read-only sample portfolio status."""
+    return MappingProxyType({
+        "total_portfolio_value": 100000.0,
+        "cash_balance": 20000.0,
+        "positions": (
+            MappingProxyType({
+                "ticker": "AAPL",
+                "quantity": 50,
+                "current_value": 7500.0
+            }),
+            MappingProxyType({
+                "ticker": "GOOGL",
+                "quantity": 20,
+                "current_value": 5000.0
+            })
+        )
+    })
+
+
 class TestRiskManagerAgent:
     """Test RiskManager Agent functionality."""
     
-    @pytest.fixture
-    def client(self):
-        """Create test client."""
-        return TestClient(app)
-    
-    def test_health_check(self, client):
+    async def test_health_check(self, client):
         """Test health check endpoint."""
-        response = client.get("/")
+        response = await client.get("/")
         assert response.status_code == 200
         data = response.json()
         assert data["service"] == "RiskManager Agent"
         assert data["status"] == "running"
     
-    def test_get_risk_limits(self, client):
+    async def test_get_risk_limits(self, client):
         """Test risk limits endpoint."""
-        response = client.get("/risk_limits")
+        response = await client.get("/risk_limits")
         assert response.status_code == 200
         data = response.json()
         
@@ -44,167 +163,57 @@ class TestRiskManagerAgent:
         assert "max_position_size_pct" in data["position_limits"]
         assert "min_cash_reserve_pct" in data["cash_limits"]
     
-    @pytest.mark.asyncio
-    async def test_a2a_endpoint_evaluate_trade_proposal(self, client):
+    async def test_a2a_endpoint_evaluate_trade_proposal(self, client, monkeypatch):
         """Test A2A endpoint for trade proposal evaluation."""
-        with patch('MCP_A2A.agents.risk_manager_agent.evaluate_trade_proposal') as mock_evaluate:
-            mock_evaluate.return_value = {
-                "decision": "APPROVE",
-                "rationale": "Trade approved",
-                "violations": [],
-                "warnings": []
-            }
-            
-            response = client.post(
-                "/a2a",
-                json={
-                    "jsonrpc": "2.0",
-                    "method": "evaluate_trade_proposal",
-                    "params": {
-                        "ticker": "AAPL",
-                        "action": "BUY",
-                        "quantity": 10,
-                        "estimated_price": 150.0,
-                        "rationale": "Strong fundamentals"
-                    },
-                    "id": "test-123"
-                }
-            )
-            
-            assert response.status_code == 200
-            data = response.json()
-            assert data["jsonrpc"] == "2.0"
-            assert data["id"] == "test-123"
-            assert "result" in data
-            assert data["result"]["decision"] == "APPROVE"
-
-
-class TestPositionSizeRisk:
-    """Test position size risk evaluation."""
-    
-    @pytest.fixture
-    def sample_portfolio(self):
-        """Create sample portfolio status."""
-        return {
+        monkeypatch.setattr(risk_manager_agent, "fetch_portfolio_status", AsyncMock(return_value={
             "total_portfolio_value": 100000.0,
-            "cash_balance": 20000.0,
-            "positions": [
-                {
+            "cash_balance": 50000.0,
+            "number_of_positions": 5,
+            "positions": []
+        }))
+        
+        response = await client.post(
+            "/a2a",
+            json={
+                "jsonrpc": "2.0",
+                "method": "evaluate_trade_proposal",
+                "params": {
                     "ticker": "AAPL",
-                    "quantity": 50,
-                    "current_value": 7500.0
+                    "action": "BUY",
+                    "quantity": 10,
+                    "estimated_price": 150.0,
+                    "rationale": "Strong fundamentals"
                 },
-                {
-                    "ticker": "GOOGL",
-                    "quantity": 20,
-                    "current_value": 5000.0
-                }
-            ]
-        }
-    
-    @pytest.fixture
-    def buy_trade_proposal(self):
-        """Create sample buy trade proposal."""
-        return TradeProposal(
-            ticker="MSFT",
-            action=TradeAction.BUY,
-            quantity=25,
-            estimated_price=400.0,  # $10,000 trade
-            rationale="Strong technical signals"
-        )
-    
-    def test_position_size_within_limits(self, buy_trade_proposal, sample_portfolio):
-        """Test position size evaluation within limits."""
-        result = evaluate_position_size_risk(buy_trade_proposal, sample_portfolio)
-        
-        assert result["passed"] is True
-        assert len(result["violations"]) == 0
-        assert "trade_value" in result["metrics"]
-        assert result["metrics"]["trade_value"] == 10000.0
-    
-    def test_position_size_exceeds_single_trade_limit(self, sample_portfolio):
-        """Test position size exceeding single trade limit."""
-        large_trade = TradeProposal(
-            ticker="EXPENSIVE",
-            action=TradeAction.BUY,
-            quantity=100,
-            estimated_price=200.0,  # $20,000 trade (exceeds $10,000 limit)
-            rationale="Large position"
-        )
-        
-        result = evaluate_position_size_risk(large_trade, sample_portfolio)
-        
-        assert result["passed"] is False
-        assert len(result["violations"]) > 0
-        assert "exceeds maximum single trade limit" in result["violations"][0]
-    
-    def test_position_size_exceeds_portfolio_percentage(self, sample_portfolio):
-        """Test position size exceeding portfolio percentage limit."""
-        # Create trade that would be >10% of portfolio
-        large_percentage_trade = TradeProposal(
-            ticker="NEWSTOCK",
-            action=TradeAction.BUY,
-            quantity=30,
-            estimated_price=400.0,  # $12,000 = 12% of $100,000 portfolio
-            rationale="Large percentage position"
-        )
-        
-        result = evaluate_position_size_risk(large_percentage_trade, sample_portfolio)
-        
-        assert result["passed"] is False
-        assert len(result["violations"]) > 0
-        assert "exceeding maximum" in result["violations"][0]
-    
-    def test_position_size_adding_to_existing_position(self, sample_portfolio):
-        """Test position size when adding to existing position."""
-        # Add to existing AAPL position (currently $7,500)
-        add_to_position = TradeProposal(
-            ticker="AAPL",
-            action=TradeAction.BUY,
-            quantity=20,
-            estimated_price=150.0,  # $3,000 more, total would be $10,500 = 10.5%
-            rationale="Adding to position"
-        )
-        
-        result = evaluate_position_size_risk(add_to_position, sample_portfolio)
-        
-        assert result["passed"] is False
-        assert len(result["violations"]) > 0
-        assert "Total position in AAPL" in result["violations"][0]
-    
-    def test_position_size_approaching_limit_warning(self, sample_portfolio):
-        """Test position size approaching limit generates warning."""
-        # Trade that approaches but doesn't exceed limit (8% of portfolio)
-        approaching_limit = TradeProposal(
-            ticker="NEWSTOCK",
-            action=TradeAction.BUY,
-            quantity=20,
-            estimated_price=400.0,  # $8,000 = 8% of portfolio
-            rationale="Approaching limit"
+                "id": "test-123"
+            }
         )
         
-        result = evaluate_position_size_risk(approaching_limit, sample_portfolio)
-        
-        assert result["passed"] is True
-        assert len(result["violations"]) == 0
-        assert len(result["warnings"]) > 0
-        assert "approaching maximum" in result["warnings"][0]
+        assert response.status_code == 200
+        data = response.json()
+        assert data["jsonrpc"] == "2.0"
+        assert data["id"] == "test-123"
+        assert "result" in data
+        assert data["result"]["decision"] == "APPROVE"
+
+
+class TestPositionSizeRisk:
+    """Test position size risk evaluation."""
     
-    def test_position_size_sell_order(self, sample_portfolio):
-        """Test position size evaluation for sell orders."""
-        sell_trade = TradeProposal(
-            ticker="AAPL",
-            action=TradeAction.SELL,
-            quantity=25,
-            estimated_price=150.0,
-            rationale="Taking profits"
-        )
-        
-        result = evaluate_position_size_risk(sell_trade, sample_portfolio)
+    @pytest.mark.parametrize("trade,passed,violation,warning", _POSITION_SIZE_CASES)
+    def test_position_size(self, sample_portfolio, trade, passed, violation, warning):
+        """Test position size evaluation."""
+        result = evaluate_position_size_risk(trade, sample_portfolio)
         
-        # Sell orders don't increase position size, so should pass
-        assert result["passed"] is True
-        assert len(result["violations"]) == 0
+        assert result["passed"] is passed
+        assert result["metrics"]["trade_value"] == trade.quantity * trade.estimated_price
+        if violation is None:
+            assert len(result["violations"]) == 0
+        else:
+            assert len(result["violations"]) > 0
+            assert violation in result["violations"][0]
+        if warning is not None:
+            assert len(result["warnings"]) > 0
+            assert warning in result["warnings"][0]
 
 
 class TestCashReserveRisk:
@@ -219,152 +228,52 @@ class TestCashReserveRisk:
             "positions": []
         }
     
-    def test_cash_reserve_sufficient(self, sample_portfolio):
-        """Test cash reserve evaluation with sufficient cash."""
-        buy_trade = TradeProposal(
-            ticker="AAPL",
-            action=TradeAction.BUY,
-            quantity=50,
-            estimated_price=150.0,  # $7,500 trade
-            rationale="Good opportunity"
-        )
-        
-        result = evaluate_cash_reserve_risk(buy_trade, sample_portfolio)
-        
-        assert result["passed"] is True
-        assert len(result["violations"]) == 0
-        assert result["metrics"]["remaining_cash_pct"] > 20  # Above minimum
-    
-    def test_cash_reserve_insufficient_cash(self, sample_portfolio):
-        """Test cash reserve evaluation with insufficient cash."""
-        large_trade = TradeProposal(
-            ticker="EXPENSIVE",
-            action=TradeAction.BUY,
-            quantity=200,
-            estimated_price=150.0,  # $30,000 trade (more than $25,000 cash)
-            rationale="Too expensive"
-        )
-        
-        result = evaluate_cash_reserve_risk(large_trade, sample_portfolio)
-        
-        assert result["passed"] is False
-        assert len(result["violations"]) > 0
-        assert "Insufficient cash" in result["violations"][0]
-    
-    def test_cash_reserve_below_minimum(self, sample_portfolio):
-        """Test cash reserve falling below minimum."""
-        # Trade that would leave less than 20% cash
-        trade_leaving_low_cash = TradeProposal(
-            ticker="AAPL",
-            action=TradeAction.BUY,
-            quantity=100,
-            estimated_price=150.0,  # $15,000 trade, leaving $10,000 = 10% cash
-            rationale="Leaves low cash"
-        )
-        
-        result = evaluate_cash_reserve_risk(trade_leaving_low_cash, sample_portfolio)
-        
-        assert result["passed"] is False
-        assert len(result["violations"]) > 0
-        assert "below minimum reserve" in result["violations"][0]
-    
-    def test_cash_reserve_approaching_minimum_warning(self, sample_portfolio):
-        """Test cash reserve approaching minimum generates warning."""
-        # Trade that approaches but doesn't violate minimum (leaves 25% cash)
-        approaching_minimum = TradeProposal(
-            ticker="AAPL",
-            action=TradeAction.BUY,
-            quantity=50,
-            estimated_price=100.0,  # $5,000 trade, leaving $20,000 = 20% cash
-            rationale="Approaching minimum"
-        )
+    @pytest.mark.parametrize("trade,passed,violation,min_remaining_pct", _CASH_RESERVE_CASES)
+    def test_cash_reserve(self, sample_portfolio, trade, passed, violation, min_remaining_pct):
+        """Test cash reserve evaluation."""
+        result = evaluate_cash_reserve_risk(trade, sample_portfolio)
         
-        result = evaluate_cash_reserve_risk(approaching_minimum, sample_portfolio)
-        
-        assert result["passed"] is True
-        assert len(result["violations"]) == 0
-        # Should generate warning as it's at exactly the minimum
-    
-    def test_cash_reserve_sell_order(self, sample_portfolio):
-        """Test cash reserve evaluation for sell orders."""
-        sell_trade = TradeProposal(
-            ticker="AAPL",
-            action=TradeAction.SELL,
-            quantity=50,
-            estimated_price=150.0,
-            rationale="Taking profits"
-        )
-        
-        result = evaluate_cash_reserve_risk(sell_trade, sample_portfolio)
-        
-        # Sell orders don't affect cash reserves negatively
-        assert result["passed"] is True
-        assert len(result["violations"]) == 0
+        assert result["passed"] is passed
+        if violation is None:
+            assert len(result["violations"]) == 0
+        else:
+            assert len(result["violations"]) > 0
+            assert violation in result["violations"][0]
+        if min_remaining_pct is not None:
+            assert result["metrics"]["remaining_cash_pct"] > min_remaining_pct
 
 
 class TestDiversificationRisk:
     """Test diversification risk evaluation."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def diversified_portfolio(self):
         """Create diversified portfolio status."""
-        positions = []
-        for i in range(10):
-            positions.append({
-                "ticker": f"STOCK{i}",
-                "quantity": 10,
-                "current_value": 5000.0
-            })
-        
-        return {
+        return MappingProxyType({
             "total_portfolio_value": 100000.0,
             "cash_balance": 50000.0,
-            "positions": positions
-        }
+            "positions": _DIVERSIFIED_POSITIONS
+        })
     
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def over_diversified_portfolio(self):
         """Create over-diversified portfolio status."""
-        positions = []
-        for i in range(25):  # Exceeds recommended maximum of 20
-            positions.append({
-                "ticker": f"STOCK{i}",
-                "quantity": 10,
-                "current_value": 2000.0
-            })
-        
-        return {
+        return MappingProxyType({
             "total_portfolio_value": 100000.0,
             "cash_balance": 50000.0,
-            "positions": positions
-        }
+            "positions": _OVER_DIVERSIFIED_POSITIONS
+        })
     
     def test_diversification_within_limits(self, diversified_portfolio):
         """Test diversification evaluation within limits."""
-        new_position_trade = TradeProposal(
-            ticker="NEWSTOCK",
-            action=TradeAction.BUY,
-            quantity=50,
-            estimated_price=100.0,
-            rationale="New position"
-        )
-        
-        result = evaluate_diversification_risk(new_position_trade, diversified_portfolio)
+        result = evaluate_diversification_risk(_NEW_POSITION, diversified_portfolio)
         
         assert result["passed"] is True
         assert len(result["violations"]) == 0
     
     def test_diversification_exceeds_position_limit(self, over_diversified_portfolio):
         """Test diversification exceeding position limit."""
-        new_position_trade = TradeProposal(
-            ticker="ANOTHERSTOCK",
-            action=TradeAction.BUY,
-            quantity=50,
-            estimated_price=100.0,
-            rationale="Too many positions"
-        )
-        
-        result = evaluate_diversification_risk(new_position_trade, over_diversified_portfolio)
+        result = evaluate_diversification_risk(_TOO_MANY_POSITIONS, over_diversified_portfolio)
         
         assert result["passed"] is False
         assert len(result["violations"]) > 0
@@ -372,15 +281,7 @@ class TestDiversificationRisk:
     
     def test_diversification_adding_to_existing_position(self, diversified_portfolio):
         """Test diversification when adding to existing position."""
-        add_to_existing = TradeProposal(
-            ticker="STOCK1",  # Existing position
-            action=TradeAction.BUY,
-            quantity=20,
-            estimated_price=100.0,
-            rationale="Adding to existing"
-        )
-        
-        result = evaluate_diversification_risk(add_to_existing, diversified_portfolio)
+        result = evaluate_diversification_risk(_ADD_TO_EXISTING, diversified_portfolio)
         
         # Adding to existing position doesn't increase position count
         assert result["passed"] is True
@@ -390,199 +291,118 @@ class TestDiversificationRisk:
 class TestTradeQualityRisk:
     """Test trade quality risk evaluation."""
     
-    def test_trade_quality_high_scores(self):
-        """Test trade quality with high fundamental and technical scores."""
-        high_quality_trade = TradeProposal(
-            ticker="QUALITY",
-            action=TradeAction.BUY,
-            quantity=50,
-            estimated_price=100.0,
-            rationale="High quality trade",
-            fundamental_score=85.0,
-            technical_confidence=0.8,
-            risk_level="low"
-        )
-        
-        result = evaluate_trade_quality_risk(high_quality_trade)
-        
-        assert result["passed"] is True
-        assert len(result["violations"]) == 0
-        assert len(result["warnings"]) == 0
-    
-    def test_trade_quality_low_fundamental_score(self):
-        """Test trade quality with low fundamental score."""
-        low_fundamental_trade = TradeProposal(
-            ticker="LOWFUND",
-            action=TradeAction.BUY,
-            quantity=50,
-            estimated_price=100.0,
-            rationale="Low fundamental score",
-            fundamental_score=20.0,  # Below minimum of 30
-            technical_confidence=0.8,
-            risk_level="medium"
-        )
+    @pytest.mark.parametrize("trade,passed,violation,min_warnings", _TRADE_QUALITY_CASES)
+    def test_trade_quality(self, trade, passed, violation, min_warnings):
+        """Test trade quality evaluation."""
+        result = evaluate_trade_quality_risk(trade)
         
-        result = evaluate_trade_quality_risk(low_fundamental_trade)
-        
-        assert result["passed"] is False
-        assert len(result["violations"]) > 0
-        assert "too low" in result["violations"][0]
-    
-    def test_trade_quality_low_technical_confidence(self):
-        """Test trade quality with low technical confidence."""
-        low_technical_trade = TradeProposal(
-            ticker="LOWTECH",
-            action=TradeAction.BUY,
-            quantity=50,
-            estimated_price=100.0,
-            rationale="Low technical confidence",
-            fundamental_score=70.0,
-            technical_confidence=0.2,  # Below minimum of 0.3
-            risk_level="medium"
-        )
-        
-        result = evaluate_trade_quality_risk(low_technical_trade)
-        
-        assert result["passed"] is False
-        assert len(result["violations"]) > 0
-        assert "too low" in result["violations"][0]
-    
-    def test_trade_quality_high_risk_level(self):
-        """Test trade quality with high risk level."""
-        high_risk_trade = TradeProposal(
-            ticker="RISKY",
-            action=TradeAction.BUY,
-            quantity=50,
-            estimated_price=100.0,
-            rationale="High risk trade",
-            fundamental_score=70.0,
-            technical_confidence=0.7,
-            risk_level="very high"
-        )
-        
-        result = evaluate_trade_quality_risk(high_risk_trade)
-        
-        assert result["passed"] is False
-        assert len(result["violations"]) > 0
-        assert "very high risk" in result["violations"][0]
-    
-    def test_trade_quality_warnings(self):
-        """Test trade quality generating warnings."""
-        warning_trade = TradeProposal(
-            ticker="WARNING",
-            action=TradeAction.BUY,
-            quantity=50,
-            estimated_price=100.0,
-            rationale="Warning level trade",
-            fundamental_score=45.0,  # Below average but above minimum
-            technical_confidence=0.4,  # Below average but above minimum
-            risk_level="high"  # High but not very high
-        )
-        
-        result = evaluate_trade_quality_risk(warning_trade)
-        
-        assert result["passed"] is True  # No violations
-        assert len(result["warnings"]) >= 2  # Should have warnings for both scores and risk
+        assert result["passed"] is passed
+        if violation is None:
+            assert len(result["violations"]) == 0
+        else:
+            assert len(result["violations"]) > 0
+            assert violation in result["violations"][0]
+        if min_warnings == 0 and passed:
+            assert len(result["warnings"]) == 0
+        assert len(result["warnings"]) >= min_warnings
 
 
 class TestIntegratedRiskEvaluation:
     """Test integrated risk evaluation functionality."""
     
+    @pytest.fixture(scope="class")
+    def patched_fetch(self):
+        """Swap in one portfolio status mock for the whole class; tests set its return value."""
+        mock_fetch = AsyncMock()
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(risk_manager_agent, "fetch_portfolio_status", mock_fetch)
+            yield mock_fetch
+    
     @pytest.mark.asyncio
-    async def test_evaluate_trade_proposal_approve(self):
+    async def test_evaluate_trade_proposal_approve(self, patched_fetch):
         """Test trade proposal evaluation that should be approved."""
-        mock_portfolio = {
+        patched_fetch.return_value = {
             "total_portfolio_value": 100000.0,
             "cash_balance": 50000.0,
             "number_of_positions": 5,
             "positions": []
         }
         
-        with patch('MCP_A2A.agents.risk_manager_agent.fetch_portfolio_status') as mock_fetch:
-            mock_fetch.return_value = mock_portfolio
-            
-            result = await evaluate_trade_proposal(
-                ticker="AAPL",
-                action="BUY",
-                quantity=50,
-                estimated_price=100.0,
-                rationale="Good opportunity",
-                fundamental_score=80.0,
-                technical_confidence=0.8,
-                risk_level="low"
-            )
-            
-            assert result["decision"] == RiskDecision.APPROVE
-            assert len(result["violations"]) == 0
+        result = await evaluate_trade_proposal(
+            ticker="AAPL",
+            action="BUY",
+            quantity=50,
+            estimated_price=100.0,
+            rationale="Good opportunity",
+            fundamental_score=80.0,
+            technical_confidence=0.8,
+            risk_level="low"
+        )
+        
+        assert result["decision"] == RiskDecision.APPROVE
+        assert len(result["violations"]) == 0
     
     @pytest.mark.asyncio
-    async def test_evaluate_trade_proposal_deny(self):
+    async def test_evaluate_trade_proposal_deny(self, patched_fetch):
         """Test trade proposal evaluation that should be denied."""
-        mock_portfolio = {
+        patched_fetch.return_value = {
             "total_portfolio_value": 100000.0,
             "cash_balance": 5000.0,  # Very low cash
             "number_of_positions": 5,
             "positions": []
         }
         
-        with patch('MCP_A2A.agents.risk_manager_agent.fetch_portfolio_status') as mock_fetch:
-            mock_fetch.return_value = mock_portfolio
-            
-            result = await evaluate_trade_proposal(
-                ticker="EXPENSIVE",
-                action="BUY",
-                quantity=100,
-                estimated_price=100.0,  # $10,000 trade with only $5,000 cash
-                rationale="Expensive trade",
-                fundamental_score=20.0,  # Low fundamental score
-                technical_confidence=0.2,  # Low technical confidence
-                risk_level="high"
-            )
-            
-            assert result["decision"] == RiskDecision.DENY
-            assert len(result["violations"]) > 0
+        result = await evaluate_trade_proposal(
+            ticker="EXPENSIVE",
+            action="BUY",
+            quantity=100,
+            estimated_price=100.0,  # $10,000 trade with only $5,000 cash
+            rationale="Expensive trade",
+            fundamental_score=20.0,  # Low fundamental score
+            technical_confidence=0.2,  # Low technical confidence
+            risk_level="high"
+        )
+        
+        assert result["decision"] == RiskDecision.DENY
+        assert len(result["violations"]) > 0
     
     @pytest.mark.asyncio
-    async def test_evaluate_trade_proposal_conditional_approve(self):
+    async def test_evaluate_trade_proposal_conditional_approve(self, patched_fetch):
         """Test trade proposal evaluation with conditional approval."""
-        mock_portfolio = {
+        patched_fetch.return_value = {
             "total_portfolio_value": 100000.0,
             "cash_balance": 25000.0,
             "number_of_positions": 18,  # Approaching limit of 20
             "positions": []
         }
         
-        with patch('MCP_A2A.agents.risk_manager_agent.fetch_portfolio_status') as mock_fetch:
-            mock_fetch.return_value = mock_portfolio
-            
-            result = await evaluate_trade_proposal(
-                ticker="WARNING",
-                action="BUY",
-                quantity=50,
-                estimated_price=100.0,
-                rationale="Warning level trade",
-                fundamental_score=45.0,  # Below average
-                technical_confidence=0.4,  # Below average
-                risk_level="medium"
-            )
-            
-            assert result["decision"] == RiskDecision.CONDITIONAL_APPROVE
-            assert len(result["violations"]) == 0
-            assert len(result["warnings"]) > 0
+        result = await evaluate_trade_proposal(
+            ticker="WARNING",
+            action="BUY",
+            quantity=50,
+            estimated_price=100.0,
+            rationale="Warning level trade",
+            fundamental_score=45.0,  # Below average
+            technical_confidence=0.4,  # Below average
+            risk_level="medium"
+        )
+        
+        assert result["decision"] == RiskDecision.CONDITIONAL_APPROVE
+        assert len(result["violations"]) == 0
+        assert len(result["warnings"]) > 0
     
     @pytest.mark.asyncio
-    async def test_evaluate_trade_proposal_portfolio_unavailable(self):
+    async def test_evaluate_trade_proposal_portfolio_unavailable(self, patched_fetch):
         """Test trade proposal evaluation when portfolio status unavailable."""
-        with patch('MCP_A2A.agents.risk_manager_agent.fetch_portfolio_status') as mock_fetch:
-            mock_fetch.return_value = None
-            
-            result = await evaluate_trade_proposal(
-                ticker="AAPL",
-                action="BUY",
-                quantity=50,
-                estimated_price=100.0,
-                rationale="Portfolio unavailable"
-            )
-            
-            assert result["decision"] == RiskDecision.DENY
-            assert "Portfolio status unavailable" in result["violations"]
\ No newline at end of file
+        patched_fetch.return_value = None
+        
+        result = await evaluate_trade_proposal(
+            ticker="AAPL",
+            action="BUY",
+            quantity=50,
+            estimated_price=100.0,
+            rationale="Portfolio unavailable"
+        )
+        
+        assert result["decision"] == RiskDecision.DENY
+        assert "Portfolio status unavailable" in result["violations"]
\ No newline at end of file
@@ -5,6 +5,7 @@ Quick validation tests to ensure basic system functionality.
 """
 
 import asyncio
+import json
 import pytest
 import httpx
 from typing import Dict, Any
@@ -12,16 +13,15 @@ from typing import Dict, Any
 from MCP_A2A.config import SERVICE_URLS
 from MCP_A2A.tests.test_config import get_test_config, get_test_strategy
 
+# Serialised once so each run posts the same prebuilt body
+_CONSERVATIVE_STRATEGY_BODY = json.dumps(dict(get_test_strategy("conservative_strategy"))).encode()
+_JSON_HEADERS = {"content-type": "application/json"}
 
+
+@pytest.mark.integration
 class TestSmokeTests:
     """Basic smoke tests for system validation."""
     
-    @pytest.fixture
-    async def http_client(self):
-        """HTTP client fixture."""
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            yield client
-    
     async def test_all_services_health(self, http_client):
         """Test that all services respond to health checks."""
         services = [
@@ -35,25 +35,25 @@ class TestSmokeTests:
             ("TradingExecutionMCP", SERVICE_URLS["trading_execution_mcp"])
         ]
         
-        for name, url in services:
-            try:
-                response = await http_client.get(f"{url}/health")
-                assert response.status_code == 200, f"{name} health check failed"
-                
-                health_data = response.json()
-                assert health_data.get("status") == "healthy", f"{name} reports unhealthy status"
-                
-            except Exception as e:
-                pytest.fail(f"{name} health check failed with error: {e}")
+        tasks = [http_client.get(f"{url}/health") for _, url in services]
+        responses = await asyncio.gather(*tasks, return_exceptions=True)
+        
+        for (name, _), response in zip(services, responses):
+            if isinstance(response, Exception):
+                pytest.fail(f"{name} health check failed with error: {response}")
+            
+            assert response.status_code == 200, f"{name} health check failed"
+            
+            health_data = response.json()
+            assert health_data.get("status") == "healthy", f"{name} reports unhealthy status"
     
     async def test_portfolio_manager_basic_endpoint(self, http_client):
         """Test basic Portfolio Manager endpoint functionality."""
         # Test the main strategy endpoint exists and accepts requests
-        strategy = get_test_strategy("conservative_strategy")
-        
         response = await http_client.post(
             f"{SERVICE_URLS['portfolio_manager']}/start_strategy",
-            json=strategy
+            content=_CONSERVATIVE_STRATEGY_BODY,
+            headers=_JSON_HEADERS
         )
         
         # Should get a valid response (success or handled error)
@@ -66,23 +66,13 @@ class TestSmokeTests:
     async def test_mcp_servers_basic_functionality(self, http_client):
         """Test basic MCP server functionality."""
         
-        # Test MarketDataMCP
+        # MarketDataMCP
         market_data_request = {
             "function": "get_stock_price",
             "arguments": {"ticker": "AAPL"}
         }
         
-        response = await http_client.post(
-            f"{SERVICE_URLS['market_data_mcp']}/mcp",
-            json=market_data_request
-        )
-        
-        assert response.status_code == 200
-        data = response.json()
-        assert "ticker" in data
-        assert "data" in data
-        
-        # Test TechnicalAnalysisMCP
+        # TechnicalAnalysisMCP
         tech_request = {
             "function": "calculate_indicator",
             "arguments": {
@@ -92,29 +82,31 @@ class TestSmokeTests:
             }
         }
         
-        response = await http_client.post(
-            f"{SERVICE_URLS['technical_analysis_mcp']}/mcp",
-            json=tech_request
-        )
-        
-        assert response.status_code == 200
-        data = response.json()
-        assert "indicator" in data
-        assert "values" in data
-        
-        # Test TradingExecutionMCP
+        # TradingExecutionMCP
         portfolio_request = {
             "function": "get_portfolio_status",
             "arguments": {}
         }
         
-        response = await http_client.post(
-            f"{SERVICE_URLS['trading_execution_mcp']}/mcp",
-            json=portfolio_request
+        # The three servers are independent, so query them concurrently
+        market_response, tech_response, portfolio_response = await asyncio.gather(
+            http_client.post(f"{SERVICE_URLS['market_data_mcp']}/mcp", json=market_data_request),
+            http_client.post(f"{SERVICE_URLS['technical_analysis_mcp']}/mcp", json=tech_request),
+            http_client.post(f"{SERVICE_URLS['trading_execution_mcp']}/mcp", json=portfolio_request)
         )
         
-        assert response.status_code == 200
-        data = response.json()
+        assert market_response.status_code == 200
+        data = market_response.json()
+        assert "ticker" in data
+        assert "data" in data
+        
+        assert tech_response.status_code == 200
+        data = tech_response.json()
+        assert "indicator" in data
+        assert "values" in data
+        
+        assert portfolio_response.status_code == 200
+        data = portfolio_response.json()
         assert "cash_balance" in data
         assert "positions" in data
     
@@ -177,17 +169,28 @@ class TestSmokeTests:
     async def test_service_urls_accessibility(self, http_client):
         """Test that all configured service URLs are accessible."""
         
-        for service_name, url in SERVICE_URLS.items():
-            try:
-                # Just test that we can connect (don't require specific endpoints)
-                response = await http_client.get(url, timeout=5.0)
-                # Accept any response that indicates the service is running
-                assert response.status_code in [200, 404, 405, 422]
-                
-            except httpx.ConnectError:
-                pytest.fail(f"Cannot connect to {service_name} at {url}")
-            except httpx.TimeoutException:
-                pytest.fail(f"Timeout connecting to {service_name} at {url}")
+        services = list(SERVICE_URLS.items())
+        
+        # Every service is local, so a short connect timeout is enough to tell it is down
+        probe_timeout = httpx.Timeout(connect=1.0, read=2.0, write=1.0, pool=1.0)
+        
+        # Just test that we can connect (don't require specific endpoints)
+        tasks = [http_client.get(url, timeout=probe_timeout) for _, url in services]
+        responses = await asyncio.gather(*tasks, return_exceptions=True)
+        
+        failures = []
+        for (service_name, url), response in zip(services, responses):
+            if isinstance(response, httpx.ConnectError):
+                failures.append(f"Cannot connect to {service_name} at {url}")
+            elif isinstance(response, httpx.TimeoutException):
+                failures.append(f"Timeout connecting to {service_name} at {url}")
+            elif isinstance(response, Exception):
+                failures.append(f"{service_name} at {url} failed with error: {response}")
+            # Accept any response that indicates the service is running
+            elif response.status_code not in [200, 404, 405, 422]:
+                failures.append(f"{service_name} at {url} returned {response.status_code}")
+        
+        assert not failures, "\n".join(failures)
     
     async def test_concurrent_health_checks(self, http_client):
         """Test concurrent access to health endpoints."""
@@ -203,7 +206,7 @@ class TestSmokeTests:
         results = await asyncio.gather(*tasks, return_exceptions=True)
         
         # Count successful health checks
-        successful_checks = sum(1 for result in results if result is True)
+        successful_checks = results.count(True)
         
         # At least 80% of services should be healthy
         min_healthy = int(len(services) * 0.8)
@@ -212,4 +215,4 @@ class TestSmokeTests:
 
 if __name__ == "__main__":
     # Run smoke tests
-    pytest.main([__file__, "-v", "--tb=short"])
\ No newline at end of file
+    pytest.main([__file__, "-v", "--tb=short", "--run-integration"])
\ No newline at end of file
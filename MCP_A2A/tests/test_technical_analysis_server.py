@@ -2,49 +2,63 @@
 Unit tests for TechnicalAnalysis MCP Server.
 """
 
+import numpy as np
 import pytest
 from fastapi.testclient import TestClient
 
 from ..mcp_servers.technical_analysis_server import (
     app, calculate_sma, calculate_ema, calculate_rsi, 
-    calculate_macd, calculate_bollinger_bands, generate_signal
+    calculate_macd, calculate_bollinger_bands, generate_signal, PriceContext
 )
 
 
+# Closing prices shared by every test, built once at import
+_CLOSES = np.array(
+    [100, 102, 101, 103, 105, 104, 106, 108, 107, 109, 111, 110, 112, 114, 113, 115, 117, 116, 118, 120],
+    dtype=np.float64
+)
+_PRICE_DATA = [{"close": close} for close in _CLOSES.tolist()]
+
+
+@pytest.fixture(scope="module")
+def sample_price_data():
+    """Sample price data for testing."""
+    return _PRICE_DATA
+
+
+@pytest.fixture(scope="module")
+def sample_prices():
+    """Sample closing prices for testing."""
+    return _CLOSES
+
+
+@pytest.fixture(scope="module")
+def indicator_bodies(sample_price_data):
+    """Indicator request bodies keyed by indicator name."""
+    return {
+        "SMA": {"price_data": sample_price_data, "indicator_name": "SMA", "params": {"period": 5}},
+        "EMA": {"price_data": sample_price_data, "indicator_name": "EMA", "params": {"period": 10}},
+        "RSI": {"price_data": sample_price_data, "indicator_name": "RSI", "params": {"period": 14}},
+        "MACD": {
+            "price_data": sample_price_data,
+            "indicator_name": "MACD",
+            "params": {"fast_period": 5, "slow_period": 10, "signal_period": 3}
+        },
+        "BB": {"price_data": sample_price_data, "indicator_name": "BB", "params": {"period": 10, "std_dev": 2.0}},
+        "UNKNOWN": {"price_data": sample_price_data, "indicator_name": "UNKNOWN", "params": {}}
+    }
+
+
+@pytest.fixture(scope="module")
+def client():
+    """Create test client shared across the module."""
+    with TestClient(app) as test_client:
+        yield test_client
+
+
 class TestTechnicalAnalysisServer:
     """Test TechnicalAnalysis MCP Server functionality."""
     
-    @pytest.fixture
-    def client(self):
-        """Create test client."""
-        return TestClient(app)
-    
-    @pytest.fixture
-    def sample_price_data(self):
-        """Sample price data for testing."""
-        return [
-            {"close": 100.0},
-            {"close": 102.0},
-            {"close": 101.0},
-            {"close": 103.0},
-            {"close": 105.0},
-            {"close": 104.0},
-            {"close": 106.0},
-            {"close": 108.0},
-            {"close": 107.0},
-            {"close": 109.0},
-            {"close": 111.0},
-            {"close": 110.0},
-            {"close": 112.0},
-            {"close": 114.0},
-            {"close": 113.0},
-            {"close": 115.0},
-            {"close": 117.0},
-            {"close": 116.0},
-            {"close": 118.0},
-            {"close": 120.0}
-        ]
-    
     def test_health_check(self, client):
         """Test health check endpoint."""
         response = client.get("/")
@@ -65,69 +79,47 @@ class TestTechnicalAnalysisServer:
         assert "MACD" in data["indicators"]
         assert "BB" in data["indicators"]
     
-    def test_calculate_sma_indicator(self, client, sample_price_data):
-        """Test SMA indicator calculation."""
+    @pytest.mark.parametrize("indicator,expected_len", [
+        ("SMA", 16),  # 20 - 5 + 1
+        ("EMA", 11),  # 20 - 10 + 1
+        ("RSI", 6),   # 20 - 14
+        ("BB", 11),   # 20 - 10 + 1
+    ])
+    def test_calculate_indicator(self, client, indicator_bodies, indicator, expected_len):
+        """Test indicator calculation for each supported indicator."""
         response = client.post(
             "/mcp/calculate_indicator",
-            json={
-                "price_data": sample_price_data,
-                "indicator_name": "SMA",
-                "params": {"period": 5}
-            }
+            json=indicator_bodies[indicator]
         )
         assert response.status_code == 200
         data = response.json()
-        assert data["indicator"] == "SMA"
-        assert "values" in data
+        assert data["indicator"] == indicator
         assert "signal" in data
         assert "confidence" in data
-        assert len(data["values"]) == len(sample_price_data) - 4  # 20 - 5 + 1 = 16
-    
-    def test_calculate_ema_indicator(self, client, sample_price_data):
-        """Test EMA indicator calculation."""
-        response = client.post(
-            "/mcp/calculate_indicator",
-            json={
-                "price_data": sample_price_data,
-                "indicator_name": "EMA",
-                "params": {"period": 10}
-            }
-        )
-        assert response.status_code == 200
-        data = response.json()
-        assert data["indicator"] == "EMA"
-        assert "values" in data
-        assert len(data["values"]) == len(sample_price_data) - 9  # 20 - 10 = 10
-    
-    def test_calculate_rsi_indicator(self, client, sample_price_data):
-        """Test RSI indicator calculation."""
-        response = client.post(
-            "/mcp/calculate_indicator",
-            json={
-                "price_data": sample_price_data,
-                "indicator_name": "RSI",
-                "params": {"period": 14}
-            }
-        )
-        assert response.status_code == 200
-        data = response.json()
-        assert data["indicator"] == "RSI"
-        assert "values" in data
-        assert len(data["values"]) == len(sample_price_data) - 14  # 20 - 14 = 6
         
-        # RSI should be between 0 and 100
-        for value in data["values"]:
-            assert 0 <= value <= 100
+        if indicator == "BB":
+            assert "components" in data
+            upper = data["components"]["upper"]
+            lower = data["components"]["lower"]
+            assert "middle" in data["components"]
+            assert len(upper) == expected_len
+            
+            # Upper band should be higher than lower band
+            for i in range(len(upper)):
+                assert upper[i] > lower[i]
+        else:
+            assert len(data["values"]) == expected_len
+            
+            # RSI should be between 0 and 100
+            if indicator == "RSI":
+                for value in data["values"]:
+                    assert 0 <= value <= 100
     
-    def test_calculate_macd_indicator(self, client, sample_price_data):
+    def test_calculate_macd_indicator(self, client, sample_price_data, indicator_bodies):
         """Test MACD indicator calculation."""
         response = client.post(
             "/mcp/calculate_indicator",
-            json={
-                "price_data": sample_price_data,
-                "indicator_name": "MACD",
-                "params": {"fast_period": 5, "slow_period": 10, "signal_period": 3}
-            }
+            json=indicator_bodies["MACD"]
         )
         assert response.status_code == 200
         data = response.json()
@@ -137,42 +129,50 @@ class TestTechnicalAnalysisServer:
         assert "signal" in data["components"]
         assert "histogram" in data["components"]
     
-    def test_calculate_bollinger_bands(self, client, sample_price_data):
-        """Test Bollinger Bands calculation."""
+    def test_unsupported_indicator(self, client, sample_price_data, indicator_bodies):
+        """Test unsupported indicator error."""
         response = client.post(
             "/mcp/calculate_indicator",
-            json={
-                "price_data": sample_price_data,
-                "indicator_name": "BB",
-                "params": {"period": 10, "std_dev": 2.0}
-            }
+            json=indicator_bodies["UNKNOWN"]
         )
-        assert response.status_code == 200
-        data = response.json()
-        assert data["indicator"] == "BB"
-        assert "components" in data
-        assert "upper" in data["components"]
-        assert "middle" in data["components"]
-        assert "lower" in data["components"]
-        
-        # Upper band should be higher than lower band
-        upper = data["components"]["upper"]
-        lower = data["components"]["lower"]
-        for i in range(len(upper)):
-            assert upper[i] > lower[i]
+        assert response.status_code == 400
     
-    def test_unsupported_indicator(self, client, sample_price_data):
-        """Test unsupported indicator error."""
+    def test_calculate_indicators_batch(self, client, sample_price_data):
+        """Test batch calculation of several indicators in one request."""
         response = client.post(
-            "/mcp/calculate_indicator",
+            "/mcp/calculate_indicators",
             json={
                 "price_data": sample_price_data,
-                "indicator_name": "UNKNOWN",
-                "params": {}
+                "indicators": [
+                    {"name": "SMA", "params": {"period": 5}},
+                    {"name": "RSI", "params": {"period": 14}},
+                    {"name": "UNKNOWN"}
+                ]
             }
         )
-        assert response.status_code == 400
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert [result["indicator"] for result in results] == ["SMA", "RSI", "UNKNOWN"]
+        assert len(results[0]["values"]) == len(sample_price_data) - 4
+        assert len(results[1]["values"]) == len(sample_price_data) - 14
+        assert "error" in results[2]
     
+    def test_calculate_indicators_fast_matches_validated(self, client, sample_price_data):
+        """Test that the unvalidated batch endpoint returns the validated endpoint's results."""
+        body = {
+            "price_data": sample_price_data,
+            "indicators": [{"name": "SMA", "params": {"period": 5}}, {"name": "RSI"}]
+        }
+        fast = client.post("/mcp/calculate_indicators_fast", json=body)
+        validated = client.post("/mcp/calculate_indicators", json=body)
+        assert fast.status_code == 200
+        assert fast.json() == validated.json()
+    
+    def test_calculate_indicators_fast_malformed_body(self, client):
+        """Test that a malformed body on the fast endpoint is a client error."""
+        response = client.post("/mcp/calculate_indicators_fast", json={"indicators": []})
+        assert response.status_code == 400
+
     def test_insufficient_data(self, client):
         """Test insufficient data error."""
         short_data = [{"close": 100.0}, {"close": 101.0}]
@@ -192,11 +192,6 @@ class TestTechnicalAnalysisServer:
 class TestIndicatorCalculations:
     """Test individual indicator calculation functions."""
     
-    @pytest.fixture
-    def sample_prices(self):
-        """Sample price data for testing."""
-        return [100, 102, 101, 103, 105, 104, 106, 108, 107, 109, 111, 110, 112, 114, 113, 115, 117, 116, 118, 120]
-    
     def test_calculate_sma(self, sample_prices):
         """Test SMA calculation."""
         sma_5 = calculate_sma(sample_prices, 5)
@@ -275,6 +270,14 @@ class TestIndicatorCalculations:
         short_prices = [100, 101, 102]
         rsi = calculate_rsi(short_prices, 14)
         assert len(rsi) == 0
+    
+    def test_shared_price_context(self, sample_prices):
+        """Test that indicators computed from a shared PriceContext match standalone results."""
+        ctx = PriceContext(sample_prices)
+        assert calculate_sma(sample_prices, 5, ctx) == calculate_sma(sample_prices, 5)
+        assert calculate_rsi(sample_prices, 14, ctx) == calculate_rsi(sample_prices, 14)
+        assert calculate_bollinger_bands(sample_prices, 10, 2.0, ctx) == calculate_bollinger_bands(sample_prices, 10, 2.0)
+        assert ctx == PriceContext(sample_prices.copy())
 
 
 class TestSignalGeneration:
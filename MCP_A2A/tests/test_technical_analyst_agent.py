@@ -3,25 +3,58 @@ Unit tests for TechnicalAnalyst Agent.
 """
 
 import pytest
+from types import SimpleNamespace
 from fastapi.testclient import TestClient
 from unittest.mock import AsyncMock, patch, MagicMock
 
+from ..agents import technical_analyst_agent
 from ..agents.technical_analyst_agent import (
     app, combine_indicator_signals, calculate_price_targets,
-    perform_technical_analysis_internal, perform_technical_analysis
+    perform_technical_analysis_internal, perform_technical_analysis, fetch_price_data
 )
 from ..models.trading_models import Signal
 from ..models.market_data import StockPrice, PriceData
 
 
+# Identical trailing bar used to pad price series past the 20-bar minimum, built once
+_FILLER = PriceData(date="2024-01-24", open=110.0, high=115.0, low=108.0, close=112.0, volume=1000000)
+
+
+@pytest.fixture(scope="module")
+def client():
+    """Create test client shared across the module."""
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="module")
+def _patched_agent():
+    """Swap the agent's downstream calls for async mocks once for the whole module."""
+    mocks = SimpleNamespace(
+        analysis=AsyncMock(),
+        internal=AsyncMock(),
+        fetch=AsyncMock(),
+        calc=AsyncMock()
+    )
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(technical_analyst_agent, "perform_technical_analysis", mocks.analysis)
+        mp.setattr(technical_analyst_agent, "perform_technical_analysis_internal", mocks.internal)
+        mp.setattr(technical_analyst_agent, "fetch_price_data", mocks.fetch)
+        mp.setattr(technical_analyst_agent, "calculate_technical_indicators", mocks.calc)
+        yield mocks
+
+
+@pytest.fixture(autouse=True)
+def agent_mocks(_patched_agent):
+    """Module-wide agent mocks, reset before each test; tests set their return values."""
+    for mock in vars(_patched_agent).values():
+        mock.reset_mock(return_value=True, side_effect=True)
+    return _patched_agent
+
+
 class TestTechnicalAnalystAgent:
     """Test TechnicalAnalyst Agent functionality."""
     
-    @pytest.fixture
-    def client(self):
-        """Create test client."""
-        return TestClient(app)
-    
     def test_health_check(self, client):
         """Test health check endpoint."""
         response = client.get("/")
@@ -31,59 +64,57 @@ class TestTechnicalAnalystAgent:
         assert data["status"] == "running"
     
     @pytest.mark.asyncio
-    async def test_a2a_endpoint_technical_analysis(self, client):
+    async def test_a2a_endpoint_technical_analysis(self, client, agent_mocks):
         """Test A2A endpoint for technical analysis."""
-        with patch('MCP_A2A.agents.technical_analyst_agent.perform_technical_analysis') as mock_analysis:
-            mock_analysis.return_value = {
-                "ticker": "AAPL",
-                "signal": "BUY",
-                "confidence": 0.8,
-                "rationale": "Strong bullish signals",
-                "indicators": {"RSI": [65.0]},
-                "price_targets": {"entry_price": 150.0, "target_price": 160.0, "stop_loss": 145.0}
+        agent_mocks.analysis.return_value = {
+            "ticker": "AAPL",
+            "signal": "BUY",
+            "confidence": 0.8,
+            "rationale": "Strong bullish signals",
+            "indicators": {"RSI": [65.0]},
+            "price_targets": {"entry_price": 150.0, "target_price": 160.0, "stop_loss": 145.0}
+        }
+        
+        response = client.post(
+            "/a2a",
+            json={
+                "jsonrpc": "2.0",
+                "method": "perform_technical_analysis",
+                "params": {"ticker": "AAPL"},
+                "id": "test-123"
             }
-            
-            response = client.post(
-                "/a2a",
-                json={
-                    "jsonrpc": "2.0",
-                    "method": "perform_technical_analysis",
-                    "params": {"ticker": "AAPL"},
-                    "id": "test-123"
-                }
-            )
-            
-            assert response.status_code == 200
-            data = response.json()
-            assert data["jsonrpc"] == "2.0"
-            assert data["id"] == "test-123"
-            assert "result" in data
-            assert data["result"]["ticker"] == "AAPL"
-            assert data["result"]["signal"] == "BUY"
+        )
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["jsonrpc"] == "2.0"
+        assert data["id"] == "test-123"
+        assert "result" in data
+        assert data["result"]["ticker"] == "AAPL"
+        assert data["result"]["signal"] == "BUY"
     
-    def test_direct_analyze_endpoint(self, client):
+    def test_direct_analyze_endpoint(self, client, agent_mocks):
         """Test direct analysis endpoint."""
-        with patch('MCP_A2A.agents.technical_analyst_agent.perform_technical_analysis') as mock_analysis:
-            mock_analysis.return_value = {
+        agent_mocks.analysis.return_value = {
+            "ticker": "GOOGL",
+            "signal": "HOLD",
+            "confidence": 0.5,
+            "rationale": "Mixed signals"
+        }
+        
+        response = client.post(
+            "/analyze",
+            json={
                 "ticker": "GOOGL",
-                "signal": "HOLD",
-                "confidence": 0.5,
-                "rationale": "Mixed signals"
+                "indicators": ["RSI", "SMA"],
+                "lookback_days": 30
             }
-            
-            response = client.post(
-                "/analyze",
-                json={
-                    "ticker": "GOOGL",
-                    "indicators": ["RSI", "SMA"],
-                    "lookback_days": 30
-                }
-            )
-            
-            assert response.status_code == 200
-            data = response.json()
-            assert data["ticker"] == "GOOGL"
-            assert data["signal"] == "HOLD"
+        )
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["ticker"] == "GOOGL"
+        assert data["signal"] == "HOLD"
 
 
 class TestSignalCombination:
@@ -201,7 +232,7 @@ class TestSignalCombination:
 class TestPriceTargets:
     """Test price target calculation functionality."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_price_data(self):
         """Create sample price data."""
         return [
@@ -210,10 +241,7 @@ class TestPriceTargets:
             PriceData(date="2024-01-03", open=106.0, high=110.0, low=104.0, close=108.0, volume=1100000),
             PriceData(date="2024-01-04", open=108.0, high=112.0, low=106.0, close=110.0, volume=1300000),
             PriceData(date="2024-01-05", open=110.0, high=115.0, low=108.0, close=112.0, volume=1400000),
-            # Add more data points to meet minimum requirement
-            *[PriceData(date=f"2024-01-{i:02d}", open=110.0, high=115.0, low=108.0, close=112.0, volume=1000000) 
-              for i in range(6, 25)]
-        ]
+        ] + [_FILLER] * 19  # Add more data points to meet minimum requirement
     
     def test_calculate_buy_price_targets(self, sample_price_data):
         """Test price target calculation for buy signals."""
@@ -275,7 +303,7 @@ class TestPriceTargets:
 class TestTechnicalAnalysisIntegration:
     """Test technical analysis integration functionality."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_price_data(self):
         """Create mock price data."""
         return StockPrice(
@@ -283,9 +311,7 @@ class TestTechnicalAnalysisIntegration:
             data=[
                 PriceData(date="2024-01-01", open=100.0, high=105.0, low=98.0, close=102.0, volume=1000000),
                 PriceData(date="2024-01-02", open=102.0, high=108.0, low=101.0, close=106.0, volume=1200000),
-                *[PriceData(date=f"2024-01-{i:02d}", open=110.0, high=115.0, low=108.0, close=112.0, volume=1000000) 
-                  for i in range(3, 25)]
-            ]
+            ] + [_FILLER] * 22
         )
     
     @pytest.fixture
@@ -309,47 +335,59 @@ class TestTechnicalAnalysisIntegration:
         ]
     
     @pytest.mark.asyncio
-    async def test_perform_technical_analysis_internal_success(self, mock_price_data, mock_indicator_results):
+    async def test_perform_technical_analysis_internal_success(self, mock_price_data, mock_indicator_results, agent_mocks):
         """Test successful technical analysis."""
-        with patch('MCP_A2A.agents.technical_analyst_agent.fetch_price_data') as mock_fetch, \
-             patch('MCP_A2A.agents.technical_analyst_agent.calculate_technical_indicator') as mock_calc:
-            
-            mock_fetch.return_value = mock_price_data
-            mock_calc.return_value = mock_indicator_results[0]  # Return first indicator result
-            
-            result = await perform_technical_analysis_internal("TEST", ["RSI"], 30)
-            
-            assert result is not None
-            assert result.ticker == "TEST"
-            assert result.signal in [Signal.BUY, Signal.SELL, Signal.HOLD]
-            assert 0.0 <= result.confidence <= 1.0
-            assert result.rationale is not None
+        
+        agent_mocks.fetch.return_value = mock_price_data
+        agent_mocks.calc.return_value = [mock_indicator_results[0]]  # Return first indicator result
+        
+        result = await perform_technical_analysis_internal("TEST", ["RSI"], 30)
+        
+        assert result is not None
+        assert result.ticker == "TEST"
+        assert result.signal in [Signal.BUY, Signal.SELL, Signal.HOLD]
+        assert 0.0 <= result.confidence <= 1.0
+        assert result.rationale is not None
     
     @pytest.mark.asyncio
-    async def test_perform_technical_analysis_internal_no_data(self):
+    async def test_perform_technical_analysis_internal_no_data(self, agent_mocks):
         """Test technical analysis with no price data."""
-        with patch('MCP_A2A.agents.technical_analyst_agent.fetch_price_data') as mock_fetch:
-            mock_fetch.return_value = None
-            
-            result = await perform_technical_analysis_internal("NODATA", ["RSI"], 30)
-            
-            assert result is None
+        agent_mocks.fetch.return_value = None
+        
+        result = await perform_technical_analysis_internal("NODATA", ["RSI"], 30)
+        
+        assert result is None
     
     @pytest.mark.asyncio
-    async def test_perform_technical_analysis_internal_no_indicators(self, mock_price_data):
+    async def test_perform_technical_analysis_internal_no_indicators(self, mock_price_data, agent_mocks):
         """Test technical analysis with no valid indicators."""
-        with patch('MCP_A2A.agents.technical_analyst_agent.fetch_price_data') as mock_fetch, \
-             patch('MCP_A2A.agents.technical_analyst_agent.calculate_technical_indicator') as mock_calc:
-            
-            mock_fetch.return_value = mock_price_data
-            mock_calc.return_value = None  # No valid indicator results
+        
+        agent_mocks.fetch.return_value = mock_price_data
+        agent_mocks.calc.return_value = None  # No valid indicator results
+        
+        result = await perform_technical_analysis_internal("TEST", ["RSI"], 30)
+        
+        assert result is None
+    
+    @pytest.mark.asyncio
+    async def test_fetch_price_data_reuses_recent_result(self, mock_price_data):
+        """Test that repeated price fetches within the TTL hit the cache."""
+        response = MagicMock(status_code=200)
+        response.json.return_value = mock_price_data.dict()
+        
+        with patch('MCP_A2A.agents.technical_analyst_agent._price_cache', {}), \
+             patch('MCP_A2A.agents.technical_analyst_agent.http_client.post', new_callable=AsyncMock) as mock_post:
+            mock_post.return_value = response
             
-            result = await perform_technical_analysis_internal("TEST", ["RSI"], 30)
+            first = await fetch_price_data("TEST", 30)
+            second = await fetch_price_data("TEST", 30)
+            await fetch_price_data("TEST", 60)
             
-            assert result is None
+            assert first is second
+            assert mock_post.call_count == 2  # One fetch per (ticker, days)
     
     @pytest.mark.asyncio
-    async def test_perform_technical_analysis_a2a_method(self):
+    async def test_perform_technical_analysis_a2a_method(self, agent_mocks):
         """Test A2A method for technical analysis."""
         mock_analysis = MagicMock()
         mock_analysis.ticker = "AAPL"
@@ -361,63 +399,56 @@ class TestTechnicalAnalysisIntegration:
         mock_analysis.target_price = 160.0
         mock_analysis.stop_loss = 145.0
         
-        with patch('MCP_A2A.agents.technical_analyst_agent.perform_technical_analysis_internal') as mock_internal:
-            mock_internal.return_value = mock_analysis
-            
-            result = await perform_technical_analysis("AAPL", ["RSI", "SMA"])
-            
-            assert result["ticker"] == "AAPL"
-            assert result["signal"] == "BUY"
-            assert result["confidence"] == 0.8
-            assert "price_targets" in result
-            assert result["price_targets"]["entry_price"] == 150.0
+        agent_mocks.internal.return_value = mock_analysis
+        
+        result = await perform_technical_analysis("AAPL", ["RSI", "SMA"])
+        
+        assert result["ticker"] == "AAPL"
+        assert result["signal"] == "BUY"
+        assert result["confidence"] == 0.8
+        assert "price_targets" in result
+        assert result["price_targets"]["entry_price"] == 150.0
     
     @pytest.mark.asyncio
-    async def test_perform_technical_analysis_failure(self):
+    async def test_perform_technical_analysis_failure(self, agent_mocks):
         """Test A2A method with analysis failure."""
-        with patch('MCP_A2A.agents.technical_analyst_agent.perform_technical_analysis_internal') as mock_internal:
-            mock_internal.return_value = None
-            
-            result = await perform_technical_analysis("FAILED", ["RSI"])
-            
-            assert result["ticker"] == "FAILED"
-            assert result["signal"] == "HOLD"
-            assert result["confidence"] == 0.0
-            assert "insufficient data" in result["rationale"].lower()
+        agent_mocks.internal.return_value = None
+        
+        result = await perform_technical_analysis("FAILED", ["RSI"])
+        
+        assert result["ticker"] == "FAILED"
+        assert result["signal"] == "HOLD"
+        assert result["confidence"] == 0.0
+        assert "insufficient data" in result["rationale"].lower()
 
 
 class TestIndicatorParameterHandling:
     """Test indicator parameter handling."""
     
     @pytest.mark.asyncio
-    async def test_default_indicator_parameters(self):
+    async def test_default_indicator_parameters(self, agent_mocks):
         """Test that default parameters are set for indicators."""
         mock_price_data = StockPrice(
             ticker="TEST",
             data=[PriceData(date="2024-01-01", open=100.0, high=105.0, low=98.0, close=102.0, volume=1000000)]
         )
         
-        with patch('MCP_A2A.agents.technical_analyst_agent.fetch_price_data') as mock_fetch, \
-             patch('MCP_A2A.agents.technical_analyst_agent.calculate_technical_indicator') as mock_calc:
-            
-            mock_fetch.return_value = mock_price_data
-            mock_calc.return_value = {
-                "indicator": "RSI",
-                "signal": "HOLD",
-                "confidence": 0.5,
-                "values": [50.0]
-            }
-            
-            await perform_technical_analysis_internal("TEST", ["RSI", "SMA", "MACD", "BB"], 30)
-            
-            # Verify that calculate_technical_indicator was called with correct parameters
-            calls = mock_calc.call_args_list
-            assert len(calls) == 4  # Four indicators
-            
-            # Check RSI parameters
-            rsi_call = calls[0]
-            assert rsi_call[0][2] == {"period": 14}  # RSI default period
-            
-            # Check SMA parameters
-            sma_call = calls[1]
-            assert sma_call[0][2] == {"period": 20}  # SMA default period
\ No newline at end of file
+        
+        agent_mocks.fetch.return_value = mock_price_data
+        agent_mocks.calc.return_value = [
+            {"indicator": name, "signal": "HOLD", "confidence": 0.5, "values": [50.0]}
+            for name in ["RSI", "SMA", "MACD", "BB"]
+        ]
+        
+        await perform_technical_analysis_internal("TEST", ["RSI", "SMA", "MACD", "BB"], 30)
+        
+        # All indicators go out in a single batch call with their default parameters
+        assert agent_mocks.calc.call_count == 1
+        specs = agent_mocks.calc.call_args[0][1]
+        assert [spec["name"] for spec in specs] == ["RSI", "SMA", "MACD", "BB"]
+        
+        params_by_indicator = {spec["name"]: spec["params"] for spec in specs}
+        assert params_by_indicator["RSI"] == {"period": 14}  # RSI default period
+        assert params_by_indicator["SMA"] == {"period": 20}  # SMA default period
+        assert params_by_indicator["MACD"] == {"fast_period": 12, "slow_period": 26, "signal_period": 9}
+        assert params_by_indicator["BB"] == {"period": 20, "std_dev": 2.0}
\ No newline at end of file
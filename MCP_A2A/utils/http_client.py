@@ -13,18 +13,51 @@ logger = get_logger(__name__)
 
 
 class HTTPClient:
-    """HTTP client with retry logic and correlation ID support."""
+    """HTTP client with retry logic, connection pooling and correlation ID support."""
     
-    def __init__(self, timeout: float = None):
+    def __init__(
+        self,
+        timeout: float = None,
+        max_connections: int = 64,
+        max_keepalive_connections: int = 32
+    ):
         """
         Initialize HTTP client.
         
         Args:
             timeout: Request timeout in seconds
+            max_connections: Maximum number of pooled connections
+            max_keepalive_connections: Maximum number of idle connections kept open
         """
         self.timeout = timeout or SYSTEM_CONFIG["request_timeout"]
         self.retry_attempts = SYSTEM_CONFIG["retry_attempts"]
         self.retry_delay = SYSTEM_CONFIG["retry_delay"]
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections
+        )
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        Return the pooled client, creating it on first use.
+        
+        Pooled connections belong to the event loop that opened them, so a
+        new client is created when called from a different loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(timeout=self.timeout, limits=self.limits)
+            self._client_loop = loop
+        return self._client
+    
+    async def aclose(self):
+        """Close the pooled client and its connections."""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+        self._client_loop = None
     
     async def post(
         self,
@@ -58,15 +91,14 @@ class HTTPClient:
         
         for attempt in range(self.retry_attempts):
             try:
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    response = await client.post(url, json=json_data, headers=headers)
-                    
-                    logger.debug(
-                        f"Received response from {url}",
-                        extra={"status_code": response.status_code}
-                    )
-                    
-                    return response
+                response = await self._get_client().post(url, json=json_data, headers=headers)
+                
+                logger.debug(
+                    f"Received response from {url}",
+                    extra={"status_code": response.status_code}
+                )
+                
+                return response
                     
             except httpx.TimeoutException:
                 logger.warning(
@@ -118,15 +150,14 @@ class HTTPClient:
         
         for attempt in range(self.retry_attempts):
             try:
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    response = await client.get(url, params=params, headers=headers)
-                    
-                    logger.debug(
-                        f"Received response from {url}",
-                        extra={"status_code": response.status_code}
-                    )
-                    
-                    return response
+                response = await self._get_client().get(url, params=params, headers=headers)
+                
+                logger.debug(
+                    f"Received response from {url}",
+                    extra={"status_code": response.status_code}
+                )
+                
+                return response
                     
             except httpx.TimeoutException:
                 logger.warning(